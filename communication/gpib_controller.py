@@ -1,17 +1,83 @@
+import threading
+
 import pyvisa
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
 
 class GPIBController:
-    def __init__(self, backend="@ni", timeout_ms=5000):
-        self.rm = pyvisa.ResourceManager(backend)
+    # Un ResourceManager por backend compartido por todos los controladores: crearlo carga la DLL
+    # de NI-VISA o, con @py, vuelve a sondear USB/TCPIP/GPIB (segundos de arranque en frío).
+    _rms = {}
+    _rms_lock = threading.Lock()
+
+    def __init__(self, backend="@ni", timeout_ms=5000, chunk_size=1024 * 1024, read_termination=None,
+                 socket_port_map=None):
+        self.rm = self._get_rm(backend)
         self.timeout_ms = timeout_ms
+        # Con el chunk_size por defecto de PyVISA (20 kB) una traza ASCII grande se parte en
+        # decenas de viRead/recv; con 1 MB se lee normalmente en una sola llamada.
+        self.chunk_size = chunk_size
+        # Solo para recursos SOCKET: terminación que usa el equipo (None -> no se escanea termchar)
+        self.read_termination = read_termination
+        # host -> puerto raw-socket (p.ej. {"192.168.1.20": 5025}). Las direcciones TCPIP ...::INSTR
+        # (VXI-11) de esos equipos se abren como ...::<puerto>::SOCKET, sin el overhead RPC de VXI-11.
+        self.socket_port_map = socket_port_map or {}
 
     def list_resources(self):
         return self.rm.list_resources()
 
+    def _socket_address(self, address):
+        """
+        Devuelve la dirección SOCKET equivalente si el equipo TCPIP tiene puerto raw conocido, o None.
+        """
+        parts = address.split("::")
+        if len(parts) < 3 or not parts[0].upper().startswith("TCPIP") or parts[-1].upper() != "INSTR":
+            return None
+        port = self.socket_port_map.get(parts[1])
+        if port is None:
+            return None
+        return f"{parts[0]}::{parts[1]}::{port}::SOCKET"
+
     def open(self, address):
+        socket_address = self._socket_address(address)
+        if socket_address is not None:
+            address = socket_address
         res = self.rm.open_resource(address)
         res.timeout = self.timeout_ms
+        res.chunk_size = self.chunk_size
+        try:
+            self.rm.visalib.set_buffer(res.session, constants.VI_READ_BUF, self.chunk_size)
+        except (NotImplementedError, VisaIOError):
+            # No todos los backends/interfaces permiten redimensionar el buffer de lectura
+            pass
+        if socket_address is not None:
+            # Sobre socket no hay EOI: los mensajes se delimitan por la terminación
+            res.read_termination = self.read_termination or "\n"
+            res.write_termination = "\n"
+        elif address.upper().endswith("::SOCKET") and self.read_termination is not None:
+            res.read_termination = self.read_termination
         return res
 
+    @classmethod
+    def _get_rm(cls, backend):
+        with cls._rms_lock:
+            rm = cls._rms.get(backend)
+            if rm is None:
+                rm = cls._rms[backend] = pyvisa.ResourceManager(backend)
+            return rm
+
     def close(self):
-        self.rm.close()
+        # El ResourceManager es compartido: solo se cierra con shutdown_all()
+        self.rm = None
+
+    @classmethod
+    def shutdown_all(cls):
+        """Cierra y olvida todos los ResourceManager compartidos."""
+        with cls._rms_lock:
+            rms = list(cls._rms.values())
+            cls._rms.clear()
+        for rm in rms:
+            try:
+                rm.close()
+            except Exception:
+                pass
@@ -2,6 +2,8 @@ from .visa_backend import VisaResourceManager
 from .base import VisaInstrument, SourcemeterBase, ImpedanceAnalyzerBase
 from .keithley_sourcemeters import Keithley2400
 from .keysight_impedance_analyzers import KeysightE4990A
+from .parallel import ParallelSMU
+from .async_visa import AsyncVisaInstrument
 
 __all__ = [
     "VisaResourceManager",
@@ -10,4 +12,6 @@ __all__ = [
     "ImpedanceAnalyzerBase",
     "Keithley2400",
     "KeysightE4990A",
+    "ParallelSMU",
+    "AsyncVisaInstrument",
 ]
\ No newline at end of file
@@ -0,0 +1,146 @@
+from __future__ import annotations
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+
+from .base import VisaInstrument
+
+
+def _job_key(job_id) -> int:
+    # read/write_asynchronously devuelven un ViJobId (ctypes) y el evento un entero
+    return int(getattr(job_id, "value", job_id))
+
+
+class AsyncVisaInstrument(VisaInstrument):
+    """
+    Variante de `VisaInstrument` con API async/await basada en eventos IO_COMPLETION de VISA.
+
+    En lugar de bloquear el hilo (o el event loop) en cada `query`, las lecturas/escrituras se
+    lanzan con viReadAsync/viWriteAsync y el handler de VISA resuelve un `asyncio.Future` al
+    completarse. Un solo hilo puede así tener en vuelo lecturas de varios instrumentos a la vez.
+
+    El handler se instala una vez al entrar en `async with inst.async_mode():` (o `async with inst:`)
+    y se desinstala al salir, de modo que el coste de preparación se amortiza en todo el bloque.
+
+    Requiere un backend VISA con operaciones asíncronas (NI-VISA, Keysight IO). pyvisa-py no las
+    implementa. Cada lectura asíncrona está limitada a `read_chunk` bytes.
+
+    Ejemplo:
+        >>> async with smu.async_mode():
+        ...     idn_smu, idn_ia = await asyncio.gather(smu.aquery("*IDN?"), ia.aquery("*IDN?"))
+    """
+
+    def __init__(self, resource, read_termination: str = "\n", write_termination: str = "\n",
+                 read_chunk: int = 20 * 1024):
+        super().__init__(resource, read_termination, write_termination)
+        self._read_termination = read_termination
+        self._read_chunk = read_chunk
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handler = None
+        self._user_handle = None
+        # Los futures pendientes (y los trabajos completados antes de registrar su future)
+        # se comparten entre el hilo de VISA y el del event loop
+        self._jobs_lock = threading.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._early: Dict[int, Tuple[int, int]] = {}
+
+    # --- Gestión del modo asíncrono ---
+    async def __aenter__(self):
+        self._loop = asyncio.get_running_loop()
+        self._handler = self._res.wrap_handler(self._on_io_completion)
+        self._user_handle = self._res.install_handler(constants.EventType.io_completion, self._handler)
+        self._res.enable_event(constants.EventType.io_completion, constants.EventMechanism.handler)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            self._res.disable_event(constants.EventType.io_completion, constants.EventMechanism.handler)
+            self._res.uninstall_handler(constants.EventType.io_completion, self._handler, self._user_handle)
+        finally:
+            self._loop = None
+            self._handler = None
+            self._user_handle = None
+            with self._jobs_lock:
+                pending = list(self._pending.values())
+                self._pending.clear()
+                self._early.clear()
+            for fut in pending:
+                fut.cancel()
+
+    @asynccontextmanager
+    async def async_mode(self):
+        """
+        Context manager asíncrono que habilita las operaciones `awrite`/`aread`/`aquery`.
+        """
+        await self.__aenter__()
+        try:
+            yield self
+        finally:
+            await self.__aexit__(None, None, None)
+
+    # --- Helpers SCPI asíncronos ---
+    async def awrite(self, cmd: str) -> None:
+        self._require_loop()
+        data = (cmd + self._write_termination).encode(self._res.encoding)
+        job_id, _ = self._res.visalib.write_asynchronously(self._res.session, data)
+        await self._wait_job(job_id)
+
+    async def aread(self) -> str:
+        self._require_loop()
+        buffer, job_id, _ = self._res.visalib.read_asynchronously(self._res.session, self._read_chunk)
+        count = await self._wait_job(job_id)
+        response = buffer.raw[:count].decode(self._res.encoding)
+        if self._read_termination and response.endswith(self._read_termination):
+            response = response[:-len(self._read_termination)]
+        return response
+
+    async def aquery(self, cmd: str) -> str:
+        await self.awrite(cmd)
+        return await self.aread()
+
+    # --- Internos ---
+    def _require_loop(self) -> None:
+        """
+        Comprueba que el modo asíncrono está activo antes de lanzar un trabajo en VISA: fuera de él
+        nadie recogería la notificación de fin y el trabajo quedaría huérfano.
+        """
+        if self._loop is None:
+            raise RuntimeError("Las operaciones asíncronas requieren 'async with inst.async_mode()'")
+
+    async def _wait_job(self, job_id) -> int:
+        """
+        Espera a que VISA notifique la finalización del trabajo y devuelve el número de bytes transferidos.
+        """
+        key = _job_key(job_id)
+        with self._jobs_lock:
+            done = self._early.pop(key, None)
+            if done is None:
+                fut = self._loop.create_future()
+                self._pending[key] = fut
+        status, count = done if done is not None else await fut
+        if status < constants.StatusCode.success:
+            raise VisaIOError(status)
+        return count
+
+    def _on_io_completion(self, resource, event, user_handle) -> None:
+        """
+        Handler de VISA (se ejecuta en un hilo de VISA, no en el del event loop).
+        """
+        key = _job_key(event.job_id)
+        result = (event.status, event.return_count)
+        with self._jobs_lock:
+            fut = self._pending.pop(key, None)
+            if fut is None:
+                # El trabajo terminó antes de que se registrara su future
+                self._early[key] = result
+                return
+        self._loop.call_soon_threadsafe(_resolve, fut, result)
+
+
+def _resolve(fut: asyncio.Future, result) -> None:
+    if not fut.done():
+        fut.set_result(result)
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, Any
 
+import numpy as np
+
 
 class Modes(Enum):
     VOLTAGE_MODE = 'VOLT'
@@ -20,17 +22,54 @@ class VisaInstrument(ABC):
         self._res = resource
         self._res.read_termination = read_termination
         self._res.write_termination = write_termination
+        self._write_termination = write_termination
 
     # --- Helpers SCPI comunes ---
     def write(self, cmd: str) -> None:
         self._res.write(cmd)
 
+    def _write_many(self, cmds: list[str]) -> None:
+        """
+        Envía varios comandos SCPI en un único mensaje compuesto separado por ';'.
+        Una sola transacción VISA en lugar de N (cada una paga la latencia del bus GPIB).
+        Los comandos deben ser absolutos (empezar por ':') para que el árbol SCPI se reinicie.
+        Si la terminación de escritura no es '\n' se envían uno a uno.
+        """
+        if self._write_termination != "\n":
+            for cmd in cmds:
+                self.write(cmd)
+            return
+        self.write(";".join(cmds))
+
     def query(self, cmd: str) -> str:
         return self._res.query(cmd)
 
+    def _read_errors(self, max_errors: int = 32) -> list[str]:
+        """
+        Vacía la cola de errores (:SYST:ERR? hasta recibir '0,...') y devuelve los errores leídos.
+        `max_errors` acota el bucle por si el instrumento nunca llegara a responder 0.
+        """
+        errors = []
+        for _ in range(max_errors):
+            err = self.query(":SYST:ERR?").strip()
+            if err.lstrip("+").startswith("0"):
+                break
+            errors.append(err)
+        return errors
+
     def read(self) -> str:
         return self._res.read()
 
+    def query_binary(self, cmd: str, datatype: str = "f", is_big_endian: bool = False,
+                     container=np.ndarray):
+        """
+        Consulta que devuelve un bloque binario IEEE-488.2 (#<n><len><datos>).
+        Preferible a `query` para datos masivos: 4 u 8 bytes por muestra en lugar de ~13 caracteres
+        ASCII, y sin parseo `float()` por muestra en Python.
+        """
+        return self._res.query_binary_values(cmd, datatype=datatype, is_big_endian=is_big_endian,
+                                             container=container)
+
     # --- Comandos SCPI estándar ---
     def idn(self) -> str:
         return self.query("*IDN?").strip()
@@ -38,6 +77,14 @@ class VisaInstrument(ABC):
     def reset(self) -> None:
         self.write("*RST")
         self.write("*CLS")
+        # *RST cambia el estado del instrumento: cualquier valor cacheado deja de ser válido
+        self.invalidate_caches()
+
+    def invalidate_caches(self) -> None:
+        """
+        Descarta el estado del instrumento cacheado en el objeto.
+        Las subclases que memoricen respuestas SCPI deben sobrescribirlo.
+        """
 
     def close(self) -> None:
         try:
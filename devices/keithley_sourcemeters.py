@@ -1,7 +1,49 @@
 from __future__ import annotations
-from typing import Dict, Any
+import re
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Any, Iterable, Iterator, Sequence, Tuple, Callable
+
+import numpy as np
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+
 from .base import SourcemeterBase, AmmeterBase, Modes, VoltmeterBase
 
+# Tablas de alias -> token SCPI, construidas una vez al cargar el módulo.
+# Las claves están en minúsculas y sin espacios: se espera que el llamador pase valores ya recortados.
+_SOURCE_MODES = {
+    "current": Modes.CURRENT_MODE,
+    "curr": Modes.CURRENT_MODE,
+    "i": Modes.CURRENT_MODE,
+    "voltage": Modes.VOLTAGE_MODE,
+    "volt": Modes.VOLTAGE_MODE,
+    "v": Modes.VOLTAGE_MODE,
+}
+_MEASURE_FUNCTIONS = {
+    "V": "VOLT",
+    "C": "CURR",
+    "I": "CURR",
+    "R": "RES",
+    "VOLT": "VOLT",
+    "CURR": "CURR",
+    "RES": "RES",
+    "VOLTAGE": "VOLT",
+    "CURRENT": "CURR",
+    "RESISTANCE": "RES",
+}
+# Elementos admitidos por :FORM:ELEM (en mayúsculas)
+_DATA_ELEMENTS = frozenset({"READ", "VOLT", "CURR", "RES", "TIME", "STAT"})
+_TERMINALS = {"front": ":ROUT:TERM FRONT", "rear": ":ROUT:TERM REAR"}
+_AUTO_RANGE = frozenset({"auto", "a"})
+# Tamaño máximo de :SOUR:LIST:<VOLT|CURR> en el 2400
+_MAX_LIST_POINTS = 100
+# Funciones en la respuesta de :SENS:FUNC? (p.ej. '"VOLT:DC","CURR:DC"'); FRES antes que RES
+_FUNC_RE = re.compile(r"(VOLT|CURR|FRES|RES)", re.IGNORECASE)
+# Caracteres que se descartan de las respuestas SCPI de texto
+_STRIP_TABLE = str.maketrans("", "", '"\t\r\n ')
+
 
 class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
     """
@@ -9,6 +51,10 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
     Ajusta si tu firmware difiere.
     """
 
+    # Comandos constantes preconstruidos, indexados por bool (False -> OFF, True -> ON)
+    _OUTP = (":OUTP OFF", ":OUTP ON")
+    _RSEN = (":SYST:RSEN OFF", ":SYST:RSEN ON")
+
     def __init__(self, resource, config: Dict[str, Any], read_termination: str = "\n", write_termination: str = "\n"):
         """
         Inicializa el instrumento usando un diccionario de configuración.
@@ -24,44 +70,106 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
                        }
         """
         super().__init__(resource)
+        # Estado memorizado para evitar :SOUR:FUNC? / :SENS:FUNC? en cada setter (un round-trip GPIB cada uno).
+        # Se actualiza en los setters que lo modifican y se descarta con invalidate_caches().
+        self._source_mode_cache: Modes | None = None
+        self._measure_function_cache: str | None = None
+        # Número de elementos configurados en :FORM:ELEM (None -> desconocido)
+        self._n_elements: int | None = None
         self.setup(config)
 
     def setup(self, config: Dict[str, Any]):
         """
         Configura el instrumento según los parámetros ya cargados en el init.
         """
-        self.set_source_mode(config["source_mode"])
-        self.set_compliance(config["compliance"])
-        self.set_source_range(config["source_range"])
-        self.set_measure_function(config["measure_function"])
-        self.set_nplc(config["nplc"])
-        self.set_terminals(config["front_rear"])
-        self.enable_remote_sense(config["remote_sense"].lower() == "y")
+        self.apply_config(config)
+
+    def apply_config(self, config: Dict[str, Any]) -> None:
+        """
+        Aplica toda la configuración de `setup` en un único mensaje SCPI compuesto.
+
+        Equivale a llamar a set_terminals, set_source_mode, set_compliance, set_source_range,
+        set_measure_function, set_nplc y enable_remote_sense, pero sin ninguna consulta previa
+        (los modos salen de `config` y quedan cacheados) y con una sola transacción VISA.
+        El mensaje empieza con *CLS para que la cola de errores solo contenga los de esta
+        configuración; al final se vacía la cola con :SYST:ERR? y se informan todos los errores.
+
+        Lanza:
+            ValueError: Si algún parámetro de `config` no es válido (antes de escribir nada).
+            RuntimeError: Si el instrumento reporta un error tras aplicar la configuración.
+        """
+        term_cmd = _TERMINALS.get(config["front_rear"].lower())
+        if term_cmd is None:
+            raise ValueError("where debe ser 'front' o 'rear'")
+        source_mode = _SOURCE_MODES.get(config["source_mode"].lower())
+        if source_mode is None:
+            raise ValueError("mode debe ser 'current'/'curr'/'i' o 'voltage'/'volt'/'v'")
+        measure_function = _MEASURE_FUNCTIONS.get(config["measure_function"].upper())
+        if measure_function is None:
+            raise ValueError(f"Modo de medición no válido: {config['measure_function']}. "
+                             f"Opciones válidas: {list(_MEASURE_FUNCTIONS.keys())}")
+
+        src = source_mode.value
+        # En modo tensión la compliance es de corriente y viceversa
+        prot = "CURR" if source_mode is Modes.VOLTAGE_MODE else "VOLT"
+        cmds = [
+            "*CLS",  # errores anteriores fuera de la cola (comando común: no altera el árbol SCPI)
+            self._OUTP[False],  # salida off por seguridad antes de conmutar terminales
+            term_cmd,
+            f":SOUR:FUNC {src}",
+            f":SENS:{prot}:PROT {config['compliance']}",
+        ]
+        source_range = config["source_range"]
+        if isinstance(source_range, str) and source_range.lower() in _AUTO_RANGE:
+            cmds.append(f":SOUR:{src}:RANG:AUTO ON")
+        else:
+            cmds += [f":SOUR:{src}:RANG {float(source_range)}", f":SOUR:{src}:RANG:AUTO OFF"]
+        cmds += [
+            f":SENS:FUNC \"{measure_function}\"",
+            f":SENS:{measure_function}:NPLC {config['nplc']}",
+            self._RSEN[config["remote_sense"].lower() == "y"],
+        ]
+
+        self._write_many(cmds)
+        self._source_mode_cache = source_mode
+        self._measure_function_cache = measure_function
+
+        errors = self._read_errors()
+        if errors:
+            raise RuntimeError(f"Error del 2400 al aplicar la configuración: {'; '.join(errors)}")
+
+    def invalidate_caches(self) -> None:
+        self._source_mode_cache = None
+        self._measure_function_cache = None
+        self._n_elements = None
 
     def output(self, on: bool) -> None:
-        self.write(f":OUTP {'ON' if on else 'OFF'}")
+        self.write(self._OUTP[bool(on)])
 
     def set_source_mode(self, mode: str) -> str:
         if mode is None:
             raise ValueError("mode no puede ser None")
 
-        m = mode.strip().lower()
-        if m in ("current", "curr", "i"):
-            self.write(":SOUR:FUNC CURR")
-            return "current"
-        if m in ("voltage", "volt", "v"):
-            self.write(":SOUR:FUNC VOLT")
-            return "voltage"
+        source_mode = _SOURCE_MODES.get(mode.lower())
+        if source_mode is None:
+            raise ValueError("mode debe ser 'current'/'curr'/'i' o 'voltage'/'volt'/'v'")
 
-        raise ValueError("mode debe ser 'current'/'curr'/'i' o 'voltage'/'volt'/'v'")
+        self.write(f":SOUR:FUNC {source_mode.value}")
+        self._source_mode_cache = source_mode
+        return "current" if source_mode is Modes.CURRENT_MODE else "voltage"
 
     def get_source_mode(self) -> Modes:
+        if self._source_mode_cache is not None:
+            return self._source_mode_cache
         resp = self.query(":SOUR:FUNC?")
-        resp = resp.strip().replace('"', '').upper()
-        if resp.startswith("VOLT"):
-            return Modes.VOLTAGE_MODE
-        if resp.startswith("CURR"):
-            return Modes.CURRENT_MODE
+        # Una sola pasada para quitar comillas/espacios; solo se pasan a mayúsculas 4 caracteres
+        head = resp.translate(_STRIP_TABLE)[:4].upper()
+        if head == "VOLT":
+            self._source_mode_cache = Modes.VOLTAGE_MODE
+            return self._source_mode_cache
+        if head == "CURR":
+            self._source_mode_cache = Modes.CURRENT_MODE
+            return self._source_mode_cache
         raise RuntimeError(f"Modo de fuente desconocido en :SOUR:FUNC? -> {resp}")
 
     def set_source_value(self, value: float) -> str:
@@ -90,64 +198,46 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
         if not elements:
             raise ValueError("La lista de elementos no puede estar vacía.")
 
-        # Opcional: Validar elementos permitidos
-        valid_elements = {"READ", "VOLT", "CURR", "RES", "TIME", "STAT"}
-        for el in elements:
-            if el.upper() not in valid_elements:
-                raise ValueError(f"Elemento no válido: {el}. Opciones válidas: {valid_elements}")
+        # Una única pasada a mayúsculas, reutilizada para validar y para construir el comando
+        upper_elements = [el.upper() for el in elements]
+        invalid = set(upper_elements) - _DATA_ELEMENTS
+        if invalid:
+            raise ValueError(f"Elementos no válidos: {sorted(invalid)}. Opciones válidas: {set(_DATA_ELEMENTS)}")
 
-        # Construir la cadena SCPI
-        formatted = ",".join(f'{el.upper()}' for el in elements)
-        command = f":FORM:ELEM {formatted}"
-        self.write(command)
+        self.write(":FORM:ELEM " + ",".join(upper_elements))
+        self._n_elements = len(upper_elements)
 
     def set_measure_function(self, function: str):
-        mode_map = {
-            "V": "VOLT",
-            "C": "CURR",
-            "I": "CURR",
-            "R": "RES",
-            "VOLT": "VOLT",
-            "CURR": "CURR",
-            "RES": "RES",
-            "VOLTAGE": "VOLT",
-            "CURRENT": "CURR",
-            "RESISTANCE": "RES"
-        }
-
-        mode_upper = function.upper()
-        if mode_upper not in mode_map:
-            raise ValueError(f"Modo de medición no válido: {function}. Opciones válidas: {list(mode_map.keys())}")
-
-        selected_mode = mode_map[mode_upper]
+        selected_mode = _MEASURE_FUNCTIONS.get(function.upper())
+        if selected_mode is None:
+            raise ValueError(f"Modo de medición no válido: {function}. "
+                             f"Opciones válidas: {list(_MEASURE_FUNCTIONS.keys())}")
+
         self.write(f":SENS:FUNC \"{selected_mode}\"")
+        self._measure_function_cache = selected_mode
 
     def get_measure_function(self) -> str:
-        valid_functions = {"VOLT", "CURR", "RES"}
+        if self._measure_function_cache is not None:
+            return self._measure_function_cache
         response = self.query(":SENS:FUNC?")
-        response = response.strip().replace('"', '').upper()
-        # Comprobar si alguno de los modos está en la cadena
-        if not any(valid_func in response.upper() for valid_func in valid_functions):
-            raise RuntimeError(f"Función de medición desconocida o no soportada: {response}")
-        return response.split(":")[0]
-
-    def set_nplc(self, nplc: float) -> set[str]:
-        funcs = self.get_measure_function()
+        match = _FUNC_RE.search(response)
+        if match is None:
+            raise RuntimeError(f"Función de medición desconocida o no soportada: {response.strip()}")
+        self._measure_function_cache = match.group(1).upper()
+        return self._measure_function_cache
+
+    def set_nplc(self, nplc: float, funcs: set[str] | None = None) -> set[str]:
+        # `funcs` permite reutilizar las funciones ya conocidas por el llamador (ver configure())
+        if funcs is None:
+            funcs = self.get_measure_function()
         applied: set[str] = set()
+        cmds: list[str] = []
 
         # Aplica a cada función reconocida
-        if "VOLT" in funcs:
-            self.write(f":SENS:VOLT:NPLC {nplc}")
-            applied.add("VOLT")
-        if "CURR" in funcs:
-            self.write(f":SENS:CURR:NPLC {nplc}")
-            applied.add("CURR")
-        if "RES" in funcs:
-            self.write(f":SENS:RES:NPLC {nplc}")
-            applied.add("RES")
-        if "FRES" in funcs:
-            self.write(f":SENS:FRES:NPLC {nplc}")
-            applied.add("FRES")
+        for func in ("VOLT", "CURR", "RES", "FRES"):
+            if func in funcs:
+                cmds.append(f":SENS:{func}:NPLC {nplc}")
+                applied.add(func)
 
         if not applied:
             # Si no hay función activa reconocible, lo indicamos de forma explícita
@@ -155,33 +245,48 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
                 f"No hay función de medida activa reconocible para aplicar NPLC (FUNC?={funcs})"
             )
 
+        # Un único mensaje compuesto para todas las funciones
+        self._write_many(cmds)
         return applied
 
     def set_terminals(self, where: str = "FRONT") -> None:
-        w = where.strip().lower()
-        if w not in ("front", "rear"):
+        term_cmd = _TERMINALS.get(where.lower())
+        if term_cmd is None:
             raise ValueError("where debe ser 'front' o 'rear'")
-        # Opcional: garantizar salida off por seguridad
-        try:
-            self.write(":OUTP OFF")
-        except Exception:
-            pass
-        self.write(f":ROUT:TERM {'FRONT' if w == 'front' else 'REAR'}")
-
-    def set_measure_range(self, value: object):
-        measure_function = self.get_measure_function()
-        command = ''
-        if isinstance(value, str) and value.upper() in {"AUTO", "A"}:
-            command = f":SENS:{measure_function}:RANG:AUTO ON"
+        # Salida off por seguridad y conmutación en un único mensaje compuesto
+        self._write_many([self._OUTP[False], term_cmd])
+
+    def set_measure_range(self, value: object, funcs: set[str] | None = None):
+        # `funcs` permite reutilizar las funciones ya conocidas por el llamador (ver configure())
+        if funcs is None:
+            funcs = {self.get_measure_function()}
+        if isinstance(value, str) and value.lower() in _AUTO_RANGE:
+            cmds = [f":SENS:{func}:RANG:AUTO ON" for func in sorted(funcs)]
         elif isinstance(value, (float, int)):
-            command = f":SENS:{measure_function}:RANG {value}"
+            cmds = []
+            for func in sorted(funcs):
+                cmds += [f":SENS:{func}:RANG {value}", f":SENS:{func}:RANG:AUTO OFF"]
         else:
             raise ValueError("El valor debe ser un número o 'AUTO'/'A'.")
-        self.write(command)
+        self._write_many(cmds)
+
+    @contextmanager
+    def configure(self) -> Iterator[Tuple[Callable[..., None], Callable[..., set[str]]]]:
+        """
+        Lee una sola vez las funciones de medida activas y devuelve `set_measure_range` y `set_nplc`
+        ligados a ese conjunto, de modo que un bloque de configuración no repita :SENS:FUNC?.
+
+        Ejemplo:
+            >>> with smu.configure() as (set_range, set_nplc):
+            ...     set_range("AUTO")
+            ...     set_nplc(10)
+        """
+        funcs = {self.get_measure_function()}
+        yield partial(self.set_measure_range, funcs=funcs), partial(self.set_nplc, funcs=funcs)
 
     def set_source_range(self, range_or_auto: "AUTO") -> str:
         func = self.get_source_mode()  # 'VOLT' o 'CURR'
-        if isinstance(range_or_auto, str) and range_or_auto.strip().lower() == "auto":
+        if isinstance(range_or_auto, str) and range_or_auto.lower() in _AUTO_RANGE:
             self.write(f":SOUR:{func.value}:RANG:AUTO ON")
             return func
 
@@ -191,12 +296,227 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
         else:
             val = float(range_or_auto)
 
-        self.write(f":SOUR:{func.value}:RANG {val}")
-        self.write(f":SOUR:{func.value}:RANG:AUTO OFF")
+        self._write_many([f":SOUR:{func.value}:RANG {val}", f":SOUR:{func.value}:RANG:AUTO OFF"])
         return func
 
     def enable_remote_sense(self, enable: bool = True) -> None:
-        self.write(f":SYST:RSEN {'ON' if enable else 'OFF'}")
+        self.write(self._RSEN[bool(enable)])
+
+    def sweep_step(self, value: float) -> float:
+        """
+        Aplica `value` a la fuente y devuelve la lectura resultante en una única transacción VISA.
+
+        Envía `:SOUR:<VOLT|CURR> <value>;:READ?`: el 2400 aplica la fuente, dispara la medida y
+        responde con la lectura, en lugar de los 2-4 intercambios de set_source_value + _measure.
+        Es el punto de entrada recomendado para bucles de barrido punto a punto.
+
+        Requiere que :FORM:ELEM tenga un único elemento (configure_data_format_elements) para que
+        la respuesta sea un solo valor ASCII.
+        """
+        mode = self.get_source_mode()
+        return self._parse_reading(self.query(f":SOUR:{mode.value} {value};:READ?"))
+
+    def pipelined_sweep(self, values: Iterable[float]) -> Iterator[float]:
+        """
+        Barrido punto a punto en el que el paso k+1 se envía antes de entregar la lectura del paso k.
+
+        Mientras el llamador consume la lectura k, el instrumento ya está aplicando y asentando la
+        fuente k+1, de modo que la latencia host<->instrumento se solapa con el settling.
+        Con NI-VISA la escritura se lanza con viWriteAsync y se espera su IO_COMPLETION justo antes
+        de la siguiente lectura; con backends sin operaciones asíncronas (@py) se escribe síncrono.
+
+        No usar cuando haya que medir con otro instrumento en cada punto: la fuente ya habrá
+        cambiado al valor siguiente cuando el llamador reciba la lectura.
+
+        Si el llamador abandona el generador antes de terminar, la lectura ya pedida se lee y se
+        descarta (o se hace un device clear) para que la siguiente consulta no reciba un valor viejo.
+        """
+        func = self.get_source_mode().value
+        visalib, session = self._res.visalib, self._res.session
+        pending = deque()  # (job_id, buffer): el buffer debe vivir hasta el IO_COMPLETION
+        unread = False  # hay un ;:READ? enviado cuya respuesta no se ha leído
+        use_async = True
+        try:
+            self._res.enable_event(constants.EventType.io_completion, constants.EventMechanism.queue)
+        except (NotImplementedError, VisaIOError):
+            use_async = False
+
+        def submit(cmd: str) -> None:
+            nonlocal use_async, unread
+            unread = True
+            if use_async:
+                # viWriteAsync lee de este buffer después de volver: se guarda en `pending`
+                buf = (cmd + self._write_termination).encode(self._res.encoding)
+                try:
+                    job_id, _ = visalib.write_asynchronously(session, buf)
+                    pending.append((job_id, buf))
+                    return
+                except NotImplementedError:
+                    use_async = False
+            self.write(cmd)
+
+        def drain() -> None:
+            while pending:
+                self._res.wait_on_event(constants.EventType.io_completion, self._res.timeout).event.close()
+                pending.popleft()
+
+        def read() -> str:
+            nonlocal unread
+            raw = self.read()
+            unread = False
+            return raw
+
+        try:
+            it = iter(values)
+            first = next(it, None)
+            if first is None:
+                return
+            submit(f":SOUR:{func} {first};:READ?")
+            for value in it:
+                drain()
+                raw = read()
+                submit(f":SOUR:{func} {value};:READ?")
+                yield self._parse_reading(raw)
+            drain()
+            yield self._parse_reading(read())
+        finally:
+            if unread:
+                # cierre anticipado (o error): descartar la respuesta pendiente
+                try:
+                    drain()
+                    self.read()
+                except VisaIOError:
+                    self._res.clear()
+            if use_async:
+                try:
+                    self._res.disable_event(constants.EventType.io_completion, constants.EventMechanism.queue)
+                    self._res.discard_events(constants.EventType.io_completion, constants.EventMechanism.queue)
+                except VisaIOError:
+                    pass
+
+    def fetch_buffer_binary(self, n: int | None = None) -> np.ndarray:
+        """
+        Lee el buffer de lecturas (:TRAC:DATA?) como bloque binario REAL,32 little endian.
+
+        Es la vía recomendada para leer buffers; la transferencia ASCII queda solo como fallback.
+        Mismos argumentos y resultado que fetch_buffer_ascii, así que ambas son intercambiables.
+
+        Parámetros:
+            n (int | None): Si se indica, devuelve solo las `n` primeras lecturas (con varios
+                elementos en :FORM:ELEM, n * n_elementos valores). None devuelve el buffer entero.
+        """
+        count = self._values_count(n)
+        return self._query_real32(":TRAC:DATA?")[:count]
+
+    def _values_count(self, n: int | None) -> int | None:
+        """
+        Número de valores que ocupan `n` lecturas del buffer (None -> todo, útil como fin de slice).
+        Se valida antes de consultar el instrumento.
+        """
+        if n is None:
+            return None
+        if n < 1:
+            raise ValueError("n debe ser >= 1")
+        return n * (self._n_elements or 1)
+
+    def sweep(self, start: float, stop: float, points: int, delay: float = 0.0) -> np.ndarray:
+        """
+        Barrido en escalera lineal ejecutado por el firmware del 2400 (:SOUR:<VOLT|CURR>:MODE SWE).
+
+        El bucle de N pasos se ejecuta dentro del instrumento y las N lecturas se devuelven en un
+        único bloque binario: ~2 transacciones VISA en lugar de 2N de un bucle punto a punto.
+        Con varios elementos en :FORM:ELEM el resultado contiene points * n_elementos valores.
+        Al terminar la fuente vuelve a modo FIXed y :TRIG:COUN a 1.
+
+        Parámetros:
+            start, stop (float): Valores inicial y final de la fuente activa.
+            points (int): Número de puntos (>= 2).
+            delay (float): Retardo de fuente en segundos antes de cada medida (:SOUR:DEL).
+        """
+        if points < 2:
+            raise ValueError("points debe ser >= 2")
+        func = self.get_source_mode().value
+        self._write_many([
+            f":SOUR:{func}:MODE SWE",
+            f":SOUR:{func}:STAR {start}",
+            f":SOUR:{func}:STOP {stop}",
+            ":SOUR:SWE:SPAC LIN",
+            f":SOUR:SWE:POIN {points}",
+            f":SOUR:DEL {delay}",
+            f":TRIG:COUN {points}",
+        ])
+        try:
+            return self._query_real32(":READ?")
+        finally:
+            self._write_many([f":SOUR:{func}:MODE FIX", ":TRIG:COUN 1"])
+
+    def sweep_list(self, values: Sequence[float], delay: float = 0.0, nplc: float | None = None) -> np.ndarray:
+        """
+        Barrido por lista arbitraria ejecutado por el firmware del 2400 (:SOUR:<VOLT|CURR>:MODE LIST).
+
+        Igual que `sweep`, pero con los puntos dados por el llamador (hasta 100 en el 2400).
+        Las lecturas se devuelven en un único bloque binario; al terminar la fuente vuelve a modo
+        FIXed y :TRIG:COUN a 1.
+
+        Parámetros:
+            values (Sequence[float]): Valores de la fuente activa, en orden.
+            delay (float): Retardo de fuente en segundos antes de cada medida (:SOUR:DEL).
+            nplc (float | None): Si se indica, se aplica antes del barrido (ver set_nplc).
+        """
+        values = list(values)
+        if not values:
+            raise ValueError("La lista de valores no puede estar vacía.")
+        if len(values) > _MAX_LIST_POINTS:
+            raise ValueError(f"El 2400 admite como máximo {_MAX_LIST_POINTS} puntos por lista")
+        if nplc is not None:
+            self.set_nplc(nplc)
+        func = self.get_source_mode().value
+        self._write_many([
+            f":SOUR:{func}:MODE LIST",
+            f":SOUR:LIST:{func} " + ",".join(str(float(v)) for v in values),
+            f":SOUR:DEL {delay}",
+            f":TRIG:COUN {len(values)}",
+        ])
+        try:
+            return self._query_real32(":READ?")
+        finally:
+            self._write_many([f":SOUR:{func}:MODE FIX", ":TRIG:COUN 1"])
+
+    def _query_real32(self, cmd: str) -> np.ndarray:
+        """
+        Ejecuta `cmd` con :FORM:DATA REAL,32 (little endian) y restaura después :FORM:DATA ASCII,
+        que es lo que esperan el resto de métodos.
+        """
+        self._write_many([":FORM:DATA REAL,32", ":FORM:BORD SWAP"])
+        try:
+            return self.query_binary(cmd, datatype="f", is_big_endian=False)
+        finally:
+            self.write(":FORM:DATA ASCII")
+
+    def fetch_buffer_ascii(self, n: int | None = None) -> np.ndarray:
+        """
+        Lee el buffer de lecturas (:TRAC:DATA?) en ASCII, parseado por el conversor en C de numpy.
+
+        A partir de ~32 puntos su coste es comparable al de fetch_buffer_binary sin cambiar el
+        formato de datos del instrumento. `n` tiene el mismo significado que en fetch_buffer_binary.
+        """
+        count = self._values_count(n)
+        return self._res.query_ascii_values(":TRAC:DATA?", separator=",",
+                                            container=lambda x: np.asarray(x, dtype=np.float32))[:count]
+
+    def measure_many(self, n: int) -> np.ndarray:
+        """
+        Realiza `n` lecturas con un solo :READ? (:TRIG:COUN n) y las devuelve como array.
+        Con varios elementos en :FORM:ELEM los valores aparecen intercalados.
+        """
+        if n < 1:
+            raise ValueError("n debe ser >= 1")
+        self.write(f":TRIG:COUN {n}")
+        try:
+            return self._res.query_ascii_values(":READ?", separator=",",
+                                                container=lambda x: np.asarray(x, dtype=np.float32))
+        finally:
+            self.write(":TRIG:COUN 1")
 
     # ********* AMMETER Y VOLTMETER INTERFACES ****************
     def configure_ammeter(self, settings: Dict[str, Any] = None) -> None:
@@ -204,11 +524,14 @@ class Keithley2400(SourcemeterBase, AmmeterBase, VoltmeterBase):
         pass
 
     def _measure(self) -> float:
-        response = self.query(":READ?")
-        # TODO: mejorar _measure. puede dar problemas cuando el equipo está formateado para medir varios elementos
-        if isinstance(response, list):
-            response = float(response.split(',')[1])  # Tomamos el segundo valor si se trata de una list,
-        return float(response)
+        return self._parse_reading(self.query(":READ?"))
+
+    def _parse_reading(self, response: str) -> float:
+        # Con un único elemento en :FORM:ELEM la respuesta es directamente el valor;
+        # si hay varios (o no se conoce el formato) se toma el primero sin partir el resto.
+        if self._n_elements == 1:
+            return float(response)
+        return float(response.split(',', 1)[0])
 
     def measure_current(self) -> float:
         return self._measure()
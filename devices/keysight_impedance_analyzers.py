@@ -2,6 +2,17 @@ from __future__ import annotations
 from .base import ImpedanceAnalyzerBase
 from typing import Dict, Any
 
+import numpy as np
+
+
+def _even_nonzero(values: np.ndarray) -> np.ndarray:
+    """
+    CALC1:DATA:FDAT? devuelve pares intercalados (re0, im0, re1, im1, ...).
+    Se quedan los valores en posiciones pares (0, 2, 4, ...) que no son cero.
+    """
+    values = values[::2]
+    return values[values != 0.0]
+
 
 class KeysightE4990A(ImpedanceAnalyzerBase):
     """
@@ -9,6 +20,10 @@ class KeysightE4990A(ImpedanceAnalyzerBase):
     Implementación concreta para Keysight E4980A (subset SCPI).
     """
 
+    # Trazas en bloque binario REAL (float64, big-endian): ~3 veces menos bytes que en ASCII.
+    # _fetch_trace depende de este formato, y *RST lo devuelve a ASCII: se reaplica tras cada reset.
+    _DATA_FORMAT = (":FORM:DATA REAL", ":FORM:BORD NORM")
+
     def __init__(self, resource, config: Dict[str, Any], read_termination: str = "\n", write_termination: str = "\n"):
         """
         Inicializa el instrumento usando un diccionario de configuración.
@@ -32,66 +47,70 @@ class KeysightE4990A(ImpedanceAnalyzerBase):
         """
 
         # Setup point-triggered sweep, Cs/Rs parameters, no DC bias.
-        self.write("TRIG:SOUR BUS")
-        self.write("INIT1:CONT ON")
-        self.write("CALC1:PAR:COUN 3")
-        self.write("CALC1:PAR1:DEF Z")
-        self.write("CALC1:PAR2:DEF TZ")
-        self.write("CALC1:PAR3:DEF CS")
-        self.write("DISP:WIND1:SPL D1_2_3")
-
-        self.write("SENS1:SWE:TYPE LIN")
-        self.write(f"SENS1:FREQ:STAR {config['f_start']}")
-        self.write(f"SENS1:FREQ:STOP {config['f_stop']}")
-        self.write(f"SENS1:SWE:POIN {config['n_points']}")
-        self.write(f"SOUR1:VOLT {config['vac_level']}")
-
-        self.write("SOUR:BIAS:STAT OFF")
-
-    def measure(self):
-        """Read Cs and Rs traces, handle interleaved data correctly."""
-        self.write("INIT1:CONT OFF")
-        self.write("ABOR")  # aborts current measurement
-        self.write("INIT1:CONT ON")
-        self.write("TRIG:SING")  # trigger single
-        self.query("*OPC?")
-
-        self.write("FORM:DATA ASCII")
-        self.write("CALC1:PAR1:SEL")
-        self.write("CALC1:DATA:FDAT?")
-        z_data = self.read()
-
-        # Convertir la cadena en una lista de floats
-        float_values = [float(val) for val in z_data.split(',')]
-
-        # Filtrar los valores en posiciones pares (0, 2, 4, ...) que no son cero
-        z_data = [val for i, val in enumerate(float_values) if i % 2 == 0 and val != 0.0]
-
-        self.write("CALC1:PAR2:SEL")
-        self.write("CALC1:DATA:FDAT?")
-        phi_data = self.read()
-
-        # Convertir la cadena en una lista de floats
-        float_values = [float(val) for val in phi_data.split(',')]
-
-        # Filtrar los valores en posiciones pares (0, 2, 4, ...) que no son cero
-        phi_data = [val for i, val in enumerate(float_values) if i % 2 == 0 and val != 0.0]
+        # Todo en un único mensaje compuesto (comandos absolutos ':' separados por ';'):
+        # una transacción VISA en lugar de una por comando.
+        self._write_many([
+            "*CLS",  # vacía la cola de errores en la misma transacción, antes de configurar
+            ":TRIG:SOUR BUS",
+            ":INIT1:CONT ON",
+            ":CALC1:PAR:COUN 3",
+            ":CALC1:PAR1:DEF Z",
+            ":CALC1:PAR2:DEF TZ",
+            ":CALC1:PAR3:DEF CS",
+            ":DISP:WIND1:SPL D1_2_3",
+
+            ":SENS1:SWE:TYPE LIN",
+            f":SENS1:FREQ:STAR {config['f_start']}",
+            f":SENS1:FREQ:STOP {config['f_stop']}",
+            f":SENS1:SWE:POIN {config['n_points']}",
+            f":SOUR1:VOLT {config['vac_level']}",
+
+            ":SOUR:BIAS:STAT OFF",
+
+            *self._DATA_FORMAT,
+        ])
+
+        # Un error en cualquier comando del mensaje compuesto solo se ve en la cola de errores
+        errors = self._read_errors()
+        if errors:
+            raise RuntimeError(f"Error del E4990A al configurar: {'; '.join(errors)}")
+
+    def arm(self) -> None:
+        """
+        Aborta la medida en curso y deja el barrido listo para el siguiente disparo.
+        No depende del punto de polarización, así que puede solaparse con la escritura del SMU.
+        """
+        self._write_many([":INIT1:CONT OFF", ":ABOR", ":INIT1:CONT ON"])  # ABOR aborts current measurement
 
-        self.write("CALC1:PAR3:SEL")
-        self.write("CALC1:DATA:FDAT?")
-        cs_data = self.read()
+    def measure(self, armed: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Read Cs and Rs traces, handle interleaved data correctly. Devuelve (z, phi, cs) como np.ndarray.
 
-        # Convertir la cadena en una lista de floats
-        float_values = [float(val) for val in cs_data.split(',')]
+        :param armed: True si ya se ha llamado a `arm()` para este punto (se omite el re-armado).
+        """
+        if not armed:
+            self.arm()
+        self.query(":TRIG:SING;*OPC?")  # trigger single y espera a que termine el barrido
 
-        # Filtrar los valores en posiciones pares (0, 2, 4, ...) que no son cero
-        cs_data = [val for i, val in enumerate(float_values) if i % 2 == 0 and val != 0.0]
+        z_data = _even_nonzero(self._fetch_trace(1))
+        phi_data = _even_nonzero(self._fetch_trace(2))
+        cs_data = _even_nonzero(self._fetch_trace(3))
 
         return z_data, phi_data, cs_data
 
+    def _fetch_trace(self, par: int) -> np.ndarray:
+        """
+        Selecciona el parámetro `par` y lee su traza como bloque binario REAL (configurado en setup),
+        todo en una sola transacción.
+        """
+        return self.query_binary(f":CALC1:PAR{par}:SEL;:CALC1:DATA:FDAT?", datatype="d", is_big_endian=True)
+
     def preset(self) -> None:
-        self.write("*RST")
-        self.write(":STAT:PRES")
+        self._write_many(["*RST", ":STAT:PRES", *self._DATA_FORMAT])
+
+    def reset(self) -> None:
+        super().reset()
+        self._write_many(list(self._DATA_FORMAT))
 
     def set_freq(self, hz: float) -> None:
         self.write(f":FREQ {hz}")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Sequence
+
+from .base import SourcemeterBase
+
+
+class ParallelSMU:
+    """
+    Reparte llamadas de medida/configuración entre varios SMU en paralelo.
+
+    Cada instrumento tiene su propio `resource` PyVISA; los hilos pasan casi todo el tiempo
+    bloqueados en viRead/viWrite (sin GIL), así que la latencia por paso pasa de la suma
+    de los tiempos de cada instrumento al máximo de ellos.
+    Un mismo recurso nunca se usa desde dos hilos a la vez: cada instrumento se protege
+    con su propio `threading.Lock`.
+
+    Ejemplo:
+        >>> with ParallelSMU([smu_a, smu_b]) as smus:
+        ...     smus.set_source_value_all([1.0, 2.0])
+        ...     currents = smus.measure_current_all()
+    """
+
+    def __init__(self, instruments: Sequence[SourcemeterBase]):
+        if not instruments:
+            raise ValueError("La lista de instrumentos no puede estar vacía.")
+        self.instr: List[SourcemeterBase] = list(instruments)
+        self._locks = [threading.Lock() for _ in self.instr]
+        self._executor = ThreadPoolExecutor(max_workers=len(self.instr))
+
+    def _call(self, index: int, fn: Callable[[SourcemeterBase], Any]) -> Any:
+        with self._locks[index]:
+            return fn(self.instr[index])
+
+    def map(self, fn: Callable[[SourcemeterBase], Any]) -> list:
+        """
+        Ejecuta `fn(instrumento)` en todos los instrumentos a la vez.
+        Devuelve los resultados en el mismo orden que `instruments`.
+        """
+        return list(self._executor.map(lambda i: self._call(i, fn), range(len(self.instr))))
+
+    def measure_current_all(self) -> list[float]:
+        return self.map(lambda i: i.measure_current())
+
+    def measure_voltage_all(self) -> list[float]:
+        return self.map(lambda i: i.measure_voltage())
+
+    def set_source_value_all(self, values: float | Iterable[float]) -> list:
+        """
+        Aplica un valor de fuente a cada instrumento.
+        Acepta un único valor (común a todos) o uno por instrumento.
+        """
+        if isinstance(values, (int, float)):
+            values = [values] * len(self.instr)
+        values = list(values)
+        if len(values) != len(self.instr):
+            raise ValueError(f"Se esperaban {len(self.instr)} valores y se recibieron {len(values)}")
+        return list(self._executor.map(
+            lambda i: self._call(i, lambda smu: smu.set_source_value(values[i])),
+            range(len(self.instr))))
+
+    def output_all(self, on: bool) -> None:
+        self.map(lambda i: i.output(on))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -7,9 +7,12 @@ class VisaResourceManager:
     backend: "@ni", "@keysight", "@py" (pyvisa-py), "@sim" (pyvisa-sim)
     """
 
-    def __init__(self, backend: str = "@ni", timeout_ms: int = 5000):
-        self.rm = pyvisa.ResourceManager()
+    def __init__(self, backend: str = "@ni", timeout_ms: int = 5000, chunk_size: int = 100 * 1024):
+        self.backend = backend
+        self.rm = pyvisa.ResourceManager(backend)
         self.timeout_ms = timeout_ms
+        # Mayor que los 20 kB por defecto de PyVISA: menos iteraciones de lectura en las trazas binarias
+        self.chunk_size = chunk_size
 
     def list_resources(self) -> tuple[str, ...]:
         return self.rm.list_resources()
@@ -17,6 +20,7 @@ class VisaResourceManager:
     def open(self, address: str):
         res = self.rm.open_resource(address)
         res.timeout = self.timeout_ms
+        res.chunk_size = self.chunk_size
         return res
 
     def close(self) -> None:
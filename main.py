@@ -1,8 +1,12 @@
 # This is a sample Python script.
 import csv
 import json
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, Any
 from datetime import datetime
+
+import numpy as np
+
 from utils.delays.delays import DelayFactory, Delay
 from devices import (
     VisaResourceManager,
@@ -16,7 +20,7 @@ from devices import (
 
 
 from config import GPIB_ADDRESS_SOURCEMETER, GPIB_ADDRESS_IMPEDANCE_ANALYZER
-from devices.base import AmmeterBase, SourcemeterBase
+from devices.base import SourcemeterBase
 
 
 def get_delay(delay_config: Dict['str', Any], callback_function=None) -> Delay:
@@ -47,34 +51,53 @@ def main_sdm_loop(sweep_config: dict,
                   source_meter: SourcemeterBase,
                   imp_analyzer: KeysightE4990A,
                   delay,
-                  output_file_name,
-                  log: bool = True):
+                  csvfile,
+                  log: bool = True,
+                  flush_every: int = 32,
+                  executor: Executor | None = None):
     # Generar puntos de barrido
     start = sweep_config["start_voltage"]
     stop = sweep_config["stop_voltage"]
     num_points = sweep_config["number_of_points"]
-    voltages = [start + i * (stop - start) / (num_points - 1) for i in range(num_points)]
+    voltages = np.linspace(start, stop, num_points)
+
+    # Un único writer sobre el fichero ya abierto; las filas se vuelcan cada `flush_every` puntos
+    writer = csv.writer(csvfile)
+    rows = []
 
     # Bucle principal SDM
     source_meter.output(True)
-    for v in voltages:
-        print(f"\nAplicando voltaje: {v:.3f} V")
-        source_meter.set_source_value(v)
-        print("Iniciando delay...")
-        delay.start()
-        while not delay.is_done():
-            pass
-        z, phi, cs = imp_analyzer.measure()
-        z_mean = sum(z) / len(z)
-        phi_mean = sum(phi) / len(phi)
-        cs_mean = sum(cs) / len(cs)
-
-        # Guardar fila en el CSV
-        with open(output_file_name, mode="a", newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([f"{v:.3f}", f"{z_mean:.5e}", f"{phi_mean:.5e}", f"{cs_mean:.5e}"])
-
-    source_meter.output(False)
+    try:
+        for v in voltages:
+            v = float(v)  # float nativo para el formateo del comando SCPI
+            print(f"\nAplicando voltaje: {v:.3f} V")
+            # El re-armado del analizador (sesión VISA propia) se solapa con la escritura del SMU.
+            # La medida en sí no se adelanta: tiene que hacerse con la polarización ya estabilizada.
+            armed = executor.submit(imp_analyzer.arm) if executor is not None else None
+            source_meter.set_source_value(v)
+            print("Iniciando delay...")
+            delay.start()
+            if armed is not None:
+                armed.result()
+            delay.wait()
+            z, phi, cs = imp_analyzer.measure(armed=armed is not None)
+            if z.size == 0 or phi.size == 0 or cs.size == 0:
+                # El filtro de valores no nulos puede dejar una traza vacía
+                print(f"Traza vacía en {v:.3f} V, punto descartado")
+                continue
+            z_mean, phi_mean, cs_mean = z.mean(), phi.mean(), cs.mean()
+
+            # Guardar fila en el CSV
+            rows.append([f"{v:.3f}", f"{z_mean:.5e}", f"{phi_mean:.5e}", f"{cs_mean:.5e}"])
+            if len(rows) >= flush_every:
+                writer.writerows(rows)
+                csvfile.flush()
+                rows.clear()
+    finally:
+        # Lo medido hasta el momento se conserva aunque el barrido se interrumpa
+        writer.writerows(rows)
+        csvfile.flush()
+        source_meter.output(False)
 
 def main():
     # carga del JSON para la configuracion
@@ -109,12 +132,13 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     file_name = f"{output_file_config['File']['name']}_{timestamp}.csv"
 
-    with open(file_name, mode="w", newline='') as csvfile:
+    with open(file_name, mode="w", newline='', buffering=1 << 16) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow([h.strip() for h in output_file_config["File"]["header"].split(",")])
 
-    # Ejecutar el bucle principal
-    main_sdm_loop(sweep_config, smu, imp_analyzer, delay, file_name)
+        # Ejecutar el bucle principal. Un hilo auxiliar basta: el otro instrumento va en el principal
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            main_sdm_loop(sweep_config, smu, imp_analyzer, delay, csvfile, executor=executor)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pyvisa
 import numpy as np
+from pyvisa import constants
 
 """
 Keysight E4990A frequency sweep (Cs-Rs mode)
@@ -12,7 +15,7 @@ devices = rm.list_resources()
 print("\nConnected VISA devices:", devices)
 
 inst = rm.open_resource('GPIB0::25::INSTR')
-inst.timeout = 30000  # 30 s per query max
+inst.timeout = 30000  # 30 s per query max (hasta conocer el tiempo de barrido, ver configure_measurement)
 print("Instrument ID:", inst.query("*IDN?").strip())
 
 # ---------------- PARAMETERS ----------------
@@ -21,29 +24,45 @@ f_start = 95e3
 f_stop = 105e3
 Vac = 0.5        # 500 mV AC level
 path = 'E:\\Adria\\CV Measurements\\'
-name1 = input('\nEnter file name (without extension): ').strip()
+
+TRACE_QUERIES = tuple(f"CALC1:PAR{n}:SEL;:CALC1:DATA:FDAT?" for n in (1, 2, 3))
 
 # ---------------- CONFIGURATION ----------------
 def configure_measurement(f_start, f_stop, Vac, points):
     """Setup point-triggered sweep, Cs/Rs parameters, no DC bias."""
-    inst.write("TRIG:SOUR BUS")
-    inst.write("INIT1:CONT ON")
-    inst.write("CALC1:PAR:COUN 3")
-    inst.write("CALC1:PAR1:DEF Z")
-    inst.write("CALC1:PAR2:DEF TZ")
-    inst.write("CALC1:PAR3:DEF CS")
-    inst.write("DISP:WIND1:SPL D1_2_3")
-
-    inst.write("SENS1:SWE:TYPE LIN")
-    inst.write(f"SENS1:FREQ:STAR {f_start}")
-    inst.write(f"SENS1:FREQ:STOP {f_stop}")
-    inst.write(f"SENS1:SWE:POIN {points}")
-
-    inst.write(f"SOUR1:VOLT {Vac}")
-
-    inst.write("SOUR:BIAS:STAT OFF")
-
-    freq_points = np.linspace(f_start, f_stop, points)
+    # Un único mensaje compuesto: comandos absolutos (':') separados por ';'
+    inst.write(";".join([
+        ":TRIG:SOUR BUS",
+        ":INIT1:CONT ON",
+        ":CALC1:PAR:COUN 3",
+        ":CALC1:PAR1:DEF Z",
+        ":CALC1:PAR2:DEF TZ",
+        ":CALC1:PAR3:DEF CS",
+        ":DISP:WIND1:SPL D1_2_3",
+
+        ":SENS1:SWE:TYPE LIN",
+        f":SENS1:FREQ:STAR {f_start}",
+        f":SENS1:FREQ:STOP {f_stop}",
+        f":SENS1:SWE:POIN {points}",
+
+        f":SOUR1:VOLT {Vac}",
+
+        ":SOUR:BIAS:STAT OFF",
+
+        # Trazas en REAL32 (float32, big-endian): la mitad de bytes por el bus que REAL (float64)
+        ":FORM:DATA REAL32",
+        ":FORM:BORD NORM",
+    ]))
+    inst.query("*OPC?")  # punto de sincronización: configuración aplicada
+
+    # Timeout proporcional al barrido real (2x, mínimo 2 s) en lugar de 30 s fijos para cualquier fallo
+    sweep_time_s = float(inst.query(":SENS1:SWE:TIME?"))
+    inst.timeout = int(max(2000, 2 * sweep_time_s * 1000))
+    # Las trazas viajan en binario: sin terminación no se busca '\n' en cada byte ni se corta
+    # un bloque que contenga 0x0A. Sobre GPIB el fin de mensaje lo marca EOI.
+    inst.read_termination = None
+
+    freq_points = np.linspace(f_start, f_stop, points, dtype=np.float64)
     print("\n--- Measurement Configuration ---")
     print(f"Points: {points}")
     print(f"Range: {f_start/1e3:.2f} – {f_stop/1e3:.2f} kHz")
@@ -51,54 +70,93 @@ def configure_measurement(f_start, f_stop, Vac, points):
     print("---------------------------------\n")
     return freq_points
 
-def get_results(points):
-    """Read Cs and Rs traces, handle interleaved data correctly."""
-    inst.write("INIT1:CONT OFF")
-    inst.write("ABOR")  # aborts current measurement
-    inst.write("INIT1:CONT ON")
-    inst.write("TRIG:SING")  # trigger single
-    inst.query("*OPC?")
-
-    inst.write("FORM:DATA REAL")
-    inst.write("CALC1:PAR1:SEL")
-    z_data = inst.query_binary_values("CALC1:DATA:FDAT?", datatype='d', is_big_endian=True)
-    z = np.array(z_data[0::2])
-
-    inst.write("CALC1:PAR2:SEL")
-    phi_data = inst.query_binary_values("CALC1:DATA:FDAT?", datatype='d', is_big_endian=True)
-    phi = np.array(phi_data[0::2])
-
-    inst.write("CALC1:PAR3:SEL")
-    cs_data = inst.query_binary_values("CALC1:DATA:FDAT?", datatype='d', is_big_endian=True)
-    cs = np.array(cs_data[0::2])
-
-    return z, phi, cs
-
-
-def save_results_as_csv(filename, path, freqs, z, phi, cs):
-    freqs = np.array(freqs).flatten()
-    z = np.array(z).flatten()
-    phi = np.array(phi).flatten()
-    cs = np.array(cs).flatten()
-
-    data = np.column_stack((freqs, z, phi, cs))
+def read_real32_block(cmd):
+    """
+    Envía `cmd` y devuelve su bloque binario IEEE-488.2 (#<n><len><datos>) como vista float32
+    big-endian sobre el buffer leído, sin pasar por el parser de query_binary_values.
+    """
+    write, read_raw = inst.write, inst.read_raw
+    write(cmd)
+    raw = read_raw()
+    start = raw.index(b"#")
+    n_digits = int(raw[start + 1:start + 2])
+    if n_digits == 0:
+        # Bloque de longitud indefinida (#0...): los datos llegan hasta la terminación. Se quita
+        # solo un '\n' (rstrip se llevaría también bytes 0x0A del último float)
+        offset = start + 2
+        end = len(raw) - 1 if raw.endswith(b"\n") else len(raw)
+        n_bytes = end - offset
+    else:
+        offset = start + 2 + n_digits
+        n_bytes = int(raw[start + 2:offset])
+    return np.frombuffer(raw, dtype=">f4", count=n_bytes // 4, offset=offset)
+
+
+def get_results(points, out=None):
+    """
+    Read Cs and Rs traces, handle interleaved data correctly.
+    Las trazas se copian en las columnas de `out` (matriz (points, 3)); si no se da, se reserva una.
+    """
+    if out is None:
+        out = np.empty((points, 3), dtype=np.float64)
+    # Métodos y constantes del recurso resueltos una sola vez para toda la secuencia
+    write = inst.write
+    srq, queue = constants.EventType.service_request, constants.EventMechanism.queue
+
+    # Fin de barrido por SRQ (bit OPC de ESR -> bit ESB de STB) en lugar de bloquear en *OPC?
+    inst.enable_event(srq, queue)
+    try:
+        # Con INIT1:CONT ON (configure_measurement) ABOR ya devuelve el barrido a espera de disparo:
+        # no hace falta conmutar INIT1:CONT OFF/ON. Todo el arranque va en un único mensaje.
+        write(":ABOR;*CLS;*ESE 1;*SRE 32;:TRIG:SING;*OPC")
+        inst.wait_on_event(srq, inst.timeout)
+        inst.read_stb()  # serial poll: limpia la petición de servicio
+    finally:
+        inst.disable_event(srq, queue)
+        write("*SRE 0;*CLS")
+
+    # Cada traza son 2*points valores (máx. 8 bytes): con un chunk de 1 MB se lee en una sola pasada
+    inst.chunk_size = max(1 << 20, 16 * points)
+
+    # Selección y lectura de cada traza (z, phi, cs) en un mismo mensaje: un round-trip GPIB por traza
+    for col, cmd in enumerate(TRACE_QUERIES):
+        out[:, col] = read_real32_block(cmd).reshape(-1, 2)[:, 0]  # partes reales intercaladas, sin copia intermedia
+
+    return out[:, 0], out[:, 1], out[:, 2]
+
+
+def save_results_as_csv(filename, path, data):
+    """`data` es la matriz (N, 4) de resultados: frecuencia, z, phi y cs por columnas."""
+    if data.ndim != 2 or data.shape[1] != 4:
+        raise ValueError(f"Se esperaba una matriz (N, 4) de resultados, no {data.shape}")
     header = "Frequency (Hz),Impedance (Ohm),Phase (Deg),Capacitance (F)"
 
     if not filename.lower().endswith(".csv"):
         filename += ".csv"
 
-    np.savetxt(path + filename, data, delimiter=",", header=header, comments='')
+    # 7 cifras significativas bastan para la resolución del E4990A y reducen a la mitad el fichero
+    np.savetxt(path + filename, data, fmt="%.6e", delimiter=",", header=header, comments='')
     print(f"✅ Data saved to: {path + filename}\n")
 
 
 # ---------------- RUN ----------------
-freq_points = configure_measurement(f_start, f_stop, Vac, Npts)
-z, phi, cs = get_results(Npts)
-save_results_as_csv(name1, path, freq_points, z, phi, cs)
-
-inst.write("DISP:WIND1:TRAC1:Y:AUTO")
-inst.write("DISP:WIND1:TRAC2:Y:AUTO")
-inst.write("DISP:WIND1:TRAC3:Y:AUTO")
+# Una única reserva para todos los resultados: columnas f, z, phi, cs
+results = np.empty((Npts, 4), dtype=np.float64)
+
+
+# La configuración se hace antes del prompt: su resumen y cualquier error salen completos antes de
+# preguntar nada. Solo el barrido (E/S GPIB, sin prints) avanza en segundo plano mientras se pide
+# el nombre del fichero.
+results[:, 0] = configure_measurement(f_start, f_stop, Vac, Npts)
+with ThreadPoolExecutor(max_workers=1) as executor:
+    acquisition = executor.submit(get_results, Npts, results[:, 1:])
+    if acquisition.done():
+        acquisition.result()  # un fallo inmediato del barrido se muestra antes del prompt
+    name1 = input('\nEnter file name (without extension): ').strip()
+    acquisition.result()
+save_results_as_csv(name1, path, results)
+
+inst.write(":DISP:WIND1:TRAC1:Y:AUTO;:DISP:WIND1:TRAC2:Y:AUTO;:DISP:WIND1:TRAC3:Y:AUTO")
 
 
 print("Measurement complete ✅")
\ No newline at end of file
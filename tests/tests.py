@@ -1,13 +1,40 @@
+import asyncio
+import copy
+import pickle
+import random
+import statistics
 import threading
 import unittest
 import time
 
-from utils.delays.delays import DelayFactory, DelayType, TimeDelay, DelayState  # 👈 usamos la factoría
-from utils.my_statistics.my_statistics import Metrics, Comparator
+from utils.data_structures.lists import LimitedList
+from utils.data_structures.others.others import lin_space
+from utils.delays.delays import DelayFactory, DelayType, TimeDelay, AsyncTimeDelay, DelayState  # 👈 usamos la factoría
+from utils.my_statistics.my_statistics import (Metrics, Comparator, RollingWindow, compute_metric,
+                                               metric_function, comparator_function)
+
+try:
+    from devices.base import VisaInstrument
+    from devices.keithley_sourcemeters import Keithley2400
+except ImportError:  # numpy/pyvisa (requirements.txt) no instalados: se omiten los tests de devices
+    VisaInstrument = Keithley2400 = None
 
 
 # ====== Test Suite ======
 
+class FakeClock:
+    """Reloj monotónico controlable para los tests: solo avanza con advance()."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
 class TestTimeDelay(unittest.TestCase):
     def setUp(self):
         self.callback_called = False
@@ -71,6 +98,66 @@ class TestTimeDelay(unittest.TestCase):
         remaining = td.remaining()
         self.assertAlmostEqual(elapsed + remaining, 0.3, delta=0.02)
 
+    def test_remaining_counts_pending_shots(self):
+        td = TimeDelay(timeout=0.2, n_shots=3)
+        td.start()
+        time.sleep(0.1)
+        self.assertAlmostEqual(td.remaining(), 0.5, delta=0.03)
+        self.assertTrue(td.wait(timeout=1.0))
+        self.assertEqual(td.remaining(), 0.0)
+
+    def test_pause_with_fake_clock(self):
+        clock = FakeClock()
+        td = TimeDelay(timeout=10.0, n_shots=2, clock=clock)
+        td.start()
+        clock.advance(4.0)
+        self.assertAlmostEqual(td.remaining(), 16.0)
+        td.pause()
+        clock.advance(100.0)  # en pausa el reloj no cuenta
+        self.assertAlmostEqual(td.remaining(), 16.0)
+        td.resume()
+        clock.advance(1.0)
+        self.assertAlmostEqual(td.remaining(), 15.0)
+        self.assertAlmostEqual(td.elapsed(), 5.0)
+        self.assertFalse(td.is_done())
+        td.reset()
+
+    def test_wait_blocks_until_done(self):
+        td = TimeDelay(timeout=0.2, callback=self.callback)
+        self.assertFalse(td.wait(timeout=0.01))  # sin start no termina nunca
+        td.start()
+        self.assertTrue(td.wait(timeout=1.0))
+        self.assertTrue(td.is_done())
+        self.assertTrue(self.callback_called)
+
+    def test_wait_cleared_on_restart(self):
+        td = TimeDelay(timeout=0.1)
+        td.start()
+        self.assertTrue(td.wait(timeout=1.0))
+        td.start()  # desde 'done' se reinicia
+        self.assertFalse(td.wait(timeout=0.01))
+        self.assertTrue(td.wait(timeout=1.0))
+
+    def test_raising_callback_still_completes(self):
+        def boom():
+            raise RuntimeError("fallo en el callback")
+
+        td = TimeDelay(timeout=0.05, callback=boom)
+        with self.assertLogs("utils.delays.delays", level="ERROR"):
+            td.start()
+            self.assertTrue(td.wait(timeout=1.0))
+            time.sleep(0.05)  # el registro se hace al terminar la función en el executor
+        self.assertTrue(td.is_done())
+
+    def test_delays_share_scheduler_thread(self):
+        delays = [TimeDelay(timeout=0.1) for _ in range(50)]
+        for td in delays:
+            td.start()
+        threads = {t.name for t in threading.enumerate()}
+        self.assertEqual(sum(name.startswith("delay-scheduler") for name in threads), 1)
+        for td in delays:
+            self.assertTrue(td.wait(timeout=1.0))
+
     def test_str_output(self):
         td = TimeDelay(timeout=1, callback=self.callback)
         s = str(td)
@@ -80,6 +167,148 @@ class TestTimeDelay(unittest.TestCase):
         self.assertIn("callback=callback", s)
 
 
+class TestDelayFactory(unittest.TestCase):
+    def test_enum_and_value_keys(self):
+        self.assertIsInstance(DelayFactory.create_delay(DelayType.TIME, timeout=1), TimeDelay)
+        self.assertIsInstance(DelayFactory.create_delay("TimeDelay", timeout=1), TimeDelay)
+        self.assertIn("StatisticsDelay", DelayFactory.available_delays())
+        self.assertTrue(all(isinstance(k, str) for k in DelayFactory.available_delays()))
+        with self.assertRaises(ValueError):
+            DelayFactory.create_delay("NoExiste")
+
+
+class TestDelayState(unittest.TestCase):
+    def test_version_is_not_a_member(self):
+        self.assertEqual(list(DelayState), [DelayState.INITIATED, DelayState.STARTED, DelayState.PAUSED,
+                                            DelayState.DONE, DelayState.CONTINUE, DelayState.ERROR])
+        self.assertNotIn("__version__", DelayState.__members__)
+        self.assertEqual(DelayState.__version__, "1.0.0")
+
+
+class TestAsyncTimeDelay(unittest.TestCase):
+    def test_shots_and_callback_on_loop(self):
+        called = []
+
+        async def run():
+            d = DelayFactory.create_delay(DelayType.ASYNC_TIME, timeout=0.05, n_shots=2,
+                                          callback=lambda: called.append(threading.current_thread()))
+            self.assertIsInstance(d, AsyncTimeDelay)
+            d.start()
+            self.assertAlmostEqual(d.remaining(), 0.1, delta=0.02)
+            await asyncio.wait_for(d.wait_async(), timeout=1.0)
+            self.assertTrue(d.is_done())
+            self.assertEqual(d.remaining(), 0.0)
+
+        asyncio.run(run())
+        # el callback se ejecuta en el hilo del loop, sin hilos adicionales
+        self.assertEqual(called, [threading.current_thread()])
+
+    def test_reset_cancels_waiters(self):
+        async def run():
+            d = AsyncTimeDelay(timeout=0.5)
+            d.start()
+            waiter = asyncio.ensure_future(d.wait_async())
+            await asyncio.sleep(0)
+            d.reset()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, timeout=1.0)
+            self.assertIs(d.state, DelayState.INITIATED)
+
+        asyncio.run(run())
+
+    def test_pause_and_resume(self):
+        async def run():
+            d = AsyncTimeDelay(timeout=0.2)
+            d.start()
+            await asyncio.sleep(0.05)
+            d.pause()
+            paused_remaining = d.remaining()
+            await asyncio.sleep(0.1)
+            self.assertEqual(d.remaining(), paused_remaining)
+            self.assertFalse(d.is_done())
+            d.resume()
+            await asyncio.wait_for(d.wait_async(), timeout=1.0)
+            self.assertTrue(d.is_done())
+
+        asyncio.run(run())
+
+
+class TestAsyncStatisticsDelay(unittest.TestCase):
+    def test_triggers_on_loop(self):
+        it = iter([12, 11, 9])
+        called = []
+
+        async def run():
+            sd = DelayFactory.create_delay(
+                delay_type=DelayType.ASYNC_STATISTICS,
+                reference_value=10.0,
+                metric=Metrics.LAST_VALUE,
+                comparator=Comparator.LESS_THAN,
+                timer_interval=0.01,
+                callback=lambda: called.append(True),
+                read_value=lambda: next(it)
+            )
+            sd.start()
+            await asyncio.wait_for(sd.wait_async(), timeout=1.0)
+            self.assertTrue(sd.is_done())
+            self.assertEqual(list(sd.values), [12, 11, 9])
+
+        asyncio.run(run())
+        self.assertEqual(called, [True])
+
+    def test_raising_callback_and_read(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        async def run():
+            sd = DelayFactory.create_delay(
+                delay_type=DelayType.ASYNC_STATISTICS,
+                reference_value=10.0,
+                metric=Metrics.LAST_VALUE,
+                comparator=Comparator.LESS_THAN,
+                timer_interval=0.01,
+                callback=boom,
+                read_value=lambda: 9
+            )
+            sd.start()
+            await asyncio.wait_for(sd.wait_async(), timeout=1.0)
+            self.assertIs(sd.state, DelayState.DONE)
+            self.assertEqual(sd.remaining(), 0.0)
+
+            sd.reset()
+            sd.read_value = boom
+            sd.start()
+            await asyncio.wait_for(sd.wait_async(), timeout=1.0)
+            self.assertIs(sd.state, DelayState.ERROR)
+            self.assertIsInstance(sd.error, RuntimeError)
+            self.assertEqual(sd.remaining(), 0.0)
+
+        with self.assertLogs("utils.delays.delays", level="ERROR") as logs:
+            asyncio.run(run())
+        self.assertEqual(len(logs.records), 2)
+
+    def test_reset_cancels_waiters_and_remaining(self):
+        async def run():
+            sd = DelayFactory.create_delay(
+                delay_type=DelayType.ASYNC_STATISTICS,
+                reference_value=0.0,
+                metric=Metrics.LAST_VALUE,
+                comparator=Comparator.LESS_THAN,
+                timer_interval=0.5,
+                read_value=lambda: 1
+            )
+            self.assertEqual(sd.remaining(), 0.5)
+            sd.start()
+            self.assertTrue(0.0 < sd.remaining() <= 0.5)
+            waiter = asyncio.ensure_future(sd.wait_async())
+            await asyncio.sleep(0)
+            sd.reset()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(run())
+
+
 # ====== Función fake de lectura de corriente ======
 def make_read_value_fake(start, step):
     """
@@ -127,6 +356,144 @@ class TestStatisticsDelay(unittest.TestCase):
 
         assert len(last_called_value) == 1
 
+    def test_wait_returns_when_condition_met(self):
+        it = iter([12, 11, 9])
+
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=10.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.01,
+            read_value=lambda: next(it)
+        )
+
+        sd.start()
+        self.assertTrue(sd.wait(timeout=1.0))
+        self.assertTrue(sd.is_done())
+
+    def test_pause_stops_reading(self):
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=-1.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.01,
+            read_value=lambda: 1.0
+        )
+
+        sd.start()
+        time.sleep(0.1)
+        sd.pause()
+        n_values = len(sd.values)
+        self.assertGreater(n_values, 0)
+        time.sleep(0.1)
+        self.assertEqual(len(sd.values), n_values)
+        sd.resume()
+        time.sleep(0.1)
+        self.assertGreater(len(sd.values), n_values)
+        window = sd.values
+        sd.reset()
+        self.assertFalse(sd.is_done())
+        self.assertIs(sd.values, window)  # la ventana se vacía en sitio
+        self.assertEqual(len(sd.values), 0)
+
+    def test_read_error_ends_delay(self):
+        def read_value():
+            raise IOError("timeout GPIB")
+
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=0.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.01,
+            read_value=read_value
+        )
+        with self.assertLogs("utils.delays.delays", level="ERROR"):
+            sd.start()
+            self.assertTrue(sd.wait(timeout=1.0))
+        self.assertIs(sd.state, DelayState.ERROR)
+        self.assertIsInstance(sd.error, IOError)
+        sd.reset()
+        self.assertIs(sd.state, DelayState.INITIATED)
+        self.assertIsNone(sd.error)
+
+    def test_metric_error_ends_delay(self):
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=1.0,
+            metric=Metrics.MEAN,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.01,
+            read_value=lambda: None  # como el lambda de main.py: la métrica no puede calcularse
+        )
+        with self.assertLogs("utils.delays.delays", level="ERROR"):
+            sd.start()
+            self.assertTrue(sd.wait(timeout=1.0))
+        self.assertIs(sd.state, DelayState.ERROR)
+        self.assertIsInstance(sd.error, TypeError)
+        self.assertEqual(sd.remaining(), 0.0)
+
+    def test_waiter_survives_reset(self):
+        values = iter([1.0, -1.0])
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=0.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.01,
+            read_value=lambda: next(values)
+        )
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(sd.wait(timeout=2.0)))
+        waiter.start()
+        time.sleep(0.05)
+        sd.reset()
+        sd.start()
+        waiter.join()
+        self.assertEqual(result, [True])
+        self.assertTrue(sd.is_done())
+
+    def test_remaining_until_next_tick(self):
+        it = iter([1.0, -1.0])
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=0.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.2,
+            read_value=lambda: next(it)
+        )
+        self.assertEqual(sd.remaining(), 0.2)
+        sd.start()
+        self.assertAlmostEqual(sd.remaining(), 0.2, delta=0.05)
+        self.assertTrue(sd.wait(timeout=2.0))
+        self.assertEqual(sd.remaining(), 0.0)
+
+    def test_ticks_at_fixed_rate(self):
+        stamps = []
+
+        def read_value():
+            stamps.append(time.monotonic())
+            time.sleep(0.01)  # lectura lenta: no debe sumarse al intervalo
+            return 1.0 if len(stamps) < 10 else -1.0
+
+        sd = DelayFactory.create_delay(
+            delay_type=DelayType.STATISTICS,
+            reference_value=0.0,
+            metric=Metrics.LAST_VALUE,
+            comparator=Comparator.LESS_THAN,
+            timer_interval=0.02,
+            read_value=read_value
+        )
+        t0 = time.monotonic()
+        sd.start()
+        self.assertTrue(sd.wait(timeout=2.0))
+        self.assertEqual(len(stamps), 10)
+        # a ritmo fijo el décimo tick cae en ~0.20 s; encadenando tras cada lectura serían ~0.30 s
+        self.assertLess(stamps[-1] - t0, 0.26)
+
     def test_window_size_limited_list(self):
         values = range(150)
         it = iter(values)
@@ -209,5 +576,224 @@ class TestStatisticsDelay(unittest.TestCase):
         assert len(last_called_value) == 0
 
 
+class TestLimitedList(unittest.TestCase):
+    def test_drops_oldest(self):
+        values = LimitedList(3, [1, 2])
+        for v in (3, 4, 5):
+            values.append(v)
+        self.assertEqual(list(values), [3, 4, 5])
+        self.assertEqual(values.max_length, 3)
+        self.assertEqual(values[0], 3)
+
+    def test_copy_and_pickle(self):
+        values = LimitedList(3, [1, 2, 3])
+        for clone in (copy.copy(values), values.copy(), copy.deepcopy(values),
+                      pickle.loads(pickle.dumps(values))):
+            self.assertIsInstance(clone, LimitedList)
+            self.assertEqual(list(clone), [1, 2, 3])
+            self.assertEqual(clone.max_length, 3)
+            clone.append(4)
+            self.assertEqual(list(clone), [2, 3, 4])
+        self.assertEqual(list(values), [1, 2, 3])
+
+    def test_list_api(self):
+        values = LimitedList(3, [3, 1, 2])
+        self.assertEqual(values[1:], [1, 2])
+        values.sort()
+        self.assertEqual(list(values), [1, 2, 3])
+        self.assertEqual(values + [4], [1, 2, 3, 4])
+        self.assertEqual([0] + values, [0, 1, 2, 3])
+        self.assertIs(type(values + [4]), list)
+        self.assertIs(type([0] + values), list)
+        self.assertTrue(LimitedList(3, [1, 2]) == [1, 2])
+        self.assertFalse(LimitedList(3, [1, 2]) != [1, 2])
+        self.assertNotEqual(LimitedList(3, [1, 2]), [2, 1])
+
+    def test_pop_index(self):
+        values = LimitedList(5, [1, 2, 3, 4, 5])
+        self.assertEqual(values.pop(), 5)
+        self.assertEqual(values.pop(0), 1)
+        self.assertEqual(values.pop(1), 3)
+        self.assertEqual(values.pop(-2), 2)
+        self.assertEqual(values, [4])
+        with self.assertRaises(IndexError):
+            values.pop(3)
+
+
+class TestLinSpace(unittest.TestCase):
+    def test_includes_both_ends(self):
+        values = lin_space(1e3, 1e6, 5)
+        self.assertIsInstance(values, list)
+        self.assertEqual(len(values), 5)
+        self.assertEqual(values[0], 1e3)
+        self.assertAlmostEqual(values[-1], 1e6)
+        self.assertEqual(lin_space(1e3, 1e6, 1), [1e3])
+
+
+class TestRollingWindow(unittest.TestCase):
+    def test_matches_statistics_over_sliding_window(self):
+        rnd = random.Random(1234)
+        window = RollingWindow(20)
+        reference = []
+        for _ in range(200):
+            value = rnd.uniform(-5.0, 5.0)
+            window.append(value)
+            reference = (reference + [value])[-20:]
+            self.assertEqual(list(window), reference)
+            self.assertAlmostEqual(window.mean(), statistics.mean(reference), places=9)
+            expected_stdev = statistics.stdev(reference) if len(reference) > 1 else 0.0
+            self.assertAlmostEqual(window.stdev(), expected_stdev, places=9)
+
+    def test_resync_removes_drift(self):
+        window = RollingWindow(4)
+        window.RESYNC_EVERY = 50
+        for i in range(1000):
+            window.append(1e8 + (i % 7) * 1e-3)
+        reference = list(window)
+        self.assertAlmostEqual(window.mean(), statistics.mean(reference), places=6)
+        self.assertAlmostEqual(window.stdev(), statistics.stdev(reference), places=6)
+
+    def test_compute_metric_uses_window(self):
+        window = RollingWindow(3)
+        for v in (1, 2, 3, 10):
+            window.append(v)
+        self.assertEqual(compute_metric(window, Metrics.LAST_VALUE), 10)
+        self.assertAlmostEqual(compute_metric(window, Metrics.MEAN), 5.0)
+        self.assertAlmostEqual(compute_metric(window, Metrics.ST_DEV), statistics.stdev([2, 3, 10]))
+        window.clear()
+        self.assertIsNone(compute_metric(window, Metrics.MEAN))
+
+    def test_compute_metric_on_plain_list(self):
+        rnd = random.Random(99)
+        values = [rnd.uniform(-1.0, 1.0) for _ in range(120)]
+        self.assertAlmostEqual(compute_metric(values, Metrics.MEAN), statistics.mean(values), places=12)
+        self.assertAlmostEqual(compute_metric(values, Metrics.ST_DEV), statistics.stdev(values), places=12)
+        self.assertEqual(compute_metric([3.0], Metrics.ST_DEV), 0.0)
+
+    def test_dispatch_functions(self):
+        window = RollingWindow(3)
+        for v in (4, 8):
+            window.append(v)
+        self.assertEqual(metric_function(Metrics.LAST_VALUE)(window), 8)
+        self.assertAlmostEqual(metric_function("mean")(window), 6.0)
+        self.assertTrue(comparator_function(Comparator.LESS_THAN)(1, 2))
+        self.assertTrue(comparator_function("GREATER_THAN")(3, 2))
+        self.assertTrue(comparator_function("equal_to")(2, 2))
+        with self.assertRaises(ValueError):
+            metric_function("median")
+
+
+class FakeResource:
+    """
+    Recurso VISA falso: registra lo escrito y responde a cada consulta con la siguiente respuesta
+    guionizada para ese comando (por defecto '0,"No error"' para :SYST:ERR?).
+    """
+
+    def __init__(self, replies=None):
+        self.replies = {cmd: list(answers) for cmd, answers in (replies or {}).items()}
+        self.log = []
+
+    def write(self, cmd):
+        self.log.append(cmd)
+
+    def query(self, cmd):
+        self.log.append(cmd)
+        answers = self.replies.get(cmd)
+        if answers:
+            return answers.pop(0)
+        if cmd == ":SYST:ERR?":
+            return '0,"No error"'
+        raise AssertionError(f"Consulta no guionizada: {cmd}")
+
+    def query_ascii_values(self, cmd, separator=",", container=list):
+        return container([float(v) for v in self.query(cmd).split(separator)])
+
+    def close(self):
+        pass
+
+
+KEITHLEY_CONFIG = {
+    "front_rear": "front",
+    "source_mode": "voltage",
+    "compliance": 0.01,
+    "source_range": "auto",
+    "measure_function": "CURR",
+    "nplc": 1,
+    "remote_sense": "n",
+}
+
+
+@unittest.skipIf(VisaInstrument is None, "requiere numpy y pyvisa")
+class TestVisaInstrument(unittest.TestCase):
+    def test_write_many_compound(self):
+        res = FakeResource()
+        VisaInstrument(res)._write_many([":A 1", ":B 2", "*CLS"])
+        self.assertEqual(res.log, [":A 1;:B 2;*CLS"])
+
+    def test_write_many_other_termination(self):
+        res = FakeResource()
+        VisaInstrument(res, write_termination="\r\n")._write_many([":A 1", ":B 2"])
+        self.assertEqual(res.log, [":A 1", ":B 2"])
+
+    def test_read_errors_drains_queue(self):
+        res = FakeResource({":SYST:ERR?": ['-113,"Undefined header"', '-222,"Data out of range"',
+                                           '+0,"No error"', '-113,"Undefined header"']})
+        errors = VisaInstrument(res)._read_errors()
+        self.assertEqual(errors, ['-113,"Undefined header"', '-222,"Data out of range"'])
+        self.assertEqual(res.log, [":SYST:ERR?"] * 3)
+
+    def test_read_errors_cap(self):
+        res = FakeResource({":SYST:ERR?": ['-350,"Queue overflow"'] * 10})
+        errors = VisaInstrument(res)._read_errors(max_errors=3)
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(len(res.log), 3)
+
+
+@unittest.skipIf(Keithley2400 is None, "requiere numpy y pyvisa")
+class TestKeithley2400Config(unittest.TestCase):
+    def test_apply_config_single_compound_write(self):
+        res = FakeResource()
+        smu = Keithley2400(res, KEITHLEY_CONFIG)
+        self.assertEqual(res.log, [
+            "*CLS;:OUTP OFF;:ROUT:TERM FRONT;:SOUR:FUNC VOLT;:SENS:CURR:PROT 0.01;"
+            ":SOUR:VOLT:RANG:AUTO ON;:SENS:FUNC \"CURR\";:SENS:CURR:NPLC 1;:SYST:RSEN OFF",
+            ":SYST:ERR?",
+        ])
+        # los modos quedan cacheados: no hace falta consultarlos
+        self.assertIs(smu.get_source_mode().value, "VOLT")
+        self.assertEqual(smu.get_measure_function(), "CURR")
+        self.assertEqual(len(res.log), 2)
+
+    def test_apply_config_reports_all_errors(self):
+        res = FakeResource({":SYST:ERR?": ['-222,"Data out of range"', '-113,"Undefined header"',
+                                           '0,"No error"']})
+        with self.assertRaises(RuntimeError) as ctx:
+            Keithley2400(res, KEITHLEY_CONFIG)
+        self.assertIn("-222", str(ctx.exception))
+        self.assertIn("-113", str(ctx.exception))
+
+    def test_invalid_config_writes_nothing(self):
+        res = FakeResource()
+        with self.assertRaises(ValueError):
+            Keithley2400(res, dict(KEITHLEY_CONFIG, source_mode="power"))
+        self.assertEqual(res.log, [])
+
+    def test_fetch_buffer_ascii_first_readings(self):
+        res = FakeResource({":TRAC:DATA?": ["1.5,2.5,3.5,4.5", "1.5,2.5,3.5,4.5"]})
+        smu = Keithley2400(res, KEITHLEY_CONFIG)
+        self.assertEqual(smu.fetch_buffer_ascii().tolist(), [1.5, 2.5, 3.5, 4.5])
+        self.assertEqual(smu.fetch_buffer_ascii(n=2).tolist(), [1.5, 2.5])
+        with self.assertRaises(ValueError):
+            smu.fetch_buffer_ascii(n=0)
+
+    def test_reset_invalidates_caches(self):
+        res = FakeResource({":SOUR:FUNC?": ["CURR"]})
+        smu = Keithley2400(res, KEITHLEY_CONFIG)
+        smu.reset()
+        self.assertEqual(res.log[-2:], ["*RST", "*CLS"])
+        self.assertIs(smu.get_source_mode().value, "CURR")
+        self.assertEqual(res.log[-1], ":SOUR:FUNC?")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
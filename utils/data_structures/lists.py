@@ -1,11 +1,67 @@
-class LimitedList(list):
-    __version__ = "1.0.0"
+from collections import deque
+
+
+class LimitedList(deque):
+    """
+    Lista de longitud máxima: al superar `max_length` se descarta el elemento más antiguo.
+    Basada en `collections.deque(maxlen=...)`, que lo hace en O(1) (antes `list.pop(0)`, O(n)).
+
+    Mantiene la semántica de `list` de la versión anterior: igualdad con listas, indexado (también
+    con slices, que devuelven una `list`), `pop(index)`, `sort()`, `+` (devuelve una `list` nueva
+    en ambos sentidos, como `list.__add__`), `copy.copy` y pickle. Diferencia conocida: ya no es
+    una subclase de `list`, así que `isinstance(x, list)` es False.
+    """
+    __version__ = "1.1.2"
+
     def __init__(self, max_length: int, *args):
-        super().__init__(*args)
+        super().__init__(*args, maxlen=max_length)
         self.max_length = max_length
 
-    def append(self, item):
-        """Añade un elemento y elimina el más antiguo si se supera el tamaño máximo."""
-        super().append(item)  # llama al append original
-        if len(self) > self.max_length:
-            self.pop(0)  # elimina el primer elemento
\ No newline at end of file
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, deque)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def pop(self, index: int = -1):
+        """Extrae y devuelve el elemento en `index` (el último por defecto), como `list.pop`."""
+        if index == -1:
+            return super().pop()
+        if index == 0:
+            return self.popleft()
+        item = self[index]
+        del self[index]
+        return item
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def sort(self, *, key=None, reverse=False) -> None:
+        """Ordena en el sitio, como `list.sort`."""
+        items = sorted(self, key=key, reverse=reverse)
+        self.clear()
+        self.extend(items)
+
+    # deque reconstruye las copias con cls(iterable, maxlen), que no encaja con este __init__
+    def __reduce__(self):
+        return type(self), (self.max_length, list(self)), self.__dict__ or None
+
+    def __copy__(self):
+        result = type(self)(self.max_length, self)
+        result.__dict__.update(self.__dict__)
+        return result
+
+    copy = __copy__
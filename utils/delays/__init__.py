@@ -1,10 +1,13 @@
 # utils/delays/__init__.py
 
 from .delays import DelayFactory, DelayType
-from .delays import TimeDelay, StatisticsDelay
+from .delays import TimeDelay, StatisticsDelay, AsyncTimeDelay, AsyncStatisticsDelay
 
 # Registro de clases por defecto
 DelayFactory.register_delay(DelayType.TIME.value, TimeDelay)
 DelayFactory.register_delay(DelayType.STATISTICS.value, StatisticsDelay)
+DelayFactory.register_delay(DelayType.ASYNC_TIME.value, AsyncTimeDelay)
+DelayFactory.register_delay(DelayType.ASYNC_STATISTICS.value, AsyncStatisticsDelay)
 
-__all__ = ["DelayFactory", "DelayType", "TimeDelay", "StatisticsDelay"]
\ No newline at end of file
+__all__ = ["DelayFactory", "DelayType", "TimeDelay", "StatisticsDelay", "AsyncTimeDelay",
+           "AsyncStatisticsDelay"]
\ No newline at end of file
@@ -1,17 +1,25 @@
+import asyncio
+import heapq
+import itertools
+import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 from enum import Enum
 from abc import ABC, abstractmethod
 
-from utils.data_structures.lists import LimitedList
 from utils.my_statistics import my_statistics
 
+logger = logging.getLogger(__name__)
+
 
 class DelayType(Enum):
     __version__ = "1.0.0"
     TIME = "TimeDelay"
     STATISTICS = "StatisticsDelay"
+    ASYNC_TIME = "AsyncTimeDelay"
+    ASYNC_STATISTICS = "AsyncStatisticsDelay"
 
 
 class DelayState(Enum):
@@ -21,10 +29,13 @@ class DelayState(Enum):
     PAUSED = 'paused'
     DONE = 'done'
     CONTINUE = 'continue'
+    ERROR = 'error'
 
 
 class Delay(ABC):
     __version__ = "1.0.0"
+    # Sin __dict__ en la jerarquía: las subclases declaran sus propios __slots__
+    __slots__ = ()
 
     @abstractmethod
     def start(self): pass
@@ -47,43 +58,149 @@ class Delay(ABC):
     @abstractmethod
     def remaining(self) -> float: pass
 
+    @abstractmethod
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bloquea el hilo llamante hasta que el delay termine (o venza `timeout`, en segundos).
+        Devuelve True si el delay ha terminado. Sustituye a `while not delay.is_done(): pass`.
+        """
+
 
 class DelayFactory:
-    __version__ = "1.0.1"
+    __version__ = "1.0.2"
     """Factory Registry para crear instancias de Delay dinámicamente."""
 
-    _registry = {}  # type: dict[str, type]
+    _registry = {}  # type: dict[str | DelayType, type]
 
     @classmethod
     def register_delay(cls, key, delay_class):
-        """Registra una clase de delay bajo una clave única."""
+        """
+        Registra una clase de delay bajo una clave única.
+        Si la clave es (o corresponde a) un DelayType, se registran tanto el miembro como su valor,
+        de modo que create_delay resuelve ambos con un único acceso al diccionario.
+        """
+        if isinstance(key, DelayType):
+            key = key.value
         cls._registry[key] = delay_class
+        if key in DelayType._value2member_map_:
+            cls._registry[DelayType(key)] = delay_class
 
     @classmethod
     def create_delay(cls, delay_type, **kwargs):
         """Crea una instancia del delay solicitado."""
-        key = delay_type.value if isinstance(delay_type, DelayType) else delay_type
-        delay_class = cls._registry.get(key)
-
-        if not delay_class:
-            raise ValueError(f"No hay delay registrado para '{key}'")
+        try:
+            delay_class = cls._registry[delay_type]
+        except KeyError:
+            key = delay_type.value if isinstance(delay_type, DelayType) else delay_type
+            raise ValueError(f"No hay delay registrado para '{key}'") from None
 
         return delay_class(**kwargs)
 
     @classmethod
     def available_delays(cls):
         """Devuelve una lista de tipos registrados."""
-        return list(cls._registry.keys())
+        return [key for key in cls._registry if isinstance(key, str)]
+
+
+class _ScheduledCall:
+    """Entrada del planificador; `cancel()` la marca y el hilo la descarta al sacarla del heap."""
+    __slots__ = ('deadline', 'seq', 'fn', 'args', 'cancelled')
+
+    def __init__(self, deadline, seq, fn, args):
+        self.deadline = deadline
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _Scheduler:
+    """
+    Planificador compartido por todos los delays: un único hilo duerme en una `threading.Condition`
+    hasta el plazo más próximo de un heap (min-heap por instante monotonic).
+
+    Las funciones vencidas se ejecutan en un pequeño ThreadPoolExecutor para que un callback lento
+    del usuario no retrase al resto de plazos. El hilo y el executor se crean en el primer uso.
+
+    Límite: el executor tiene MAX_WORKERS hilos compartidos por todos los delays, y en él se
+    ejecutan tanto los callbacks de usuario como los `read_value` de StatisticsDelay (E/S de
+    instrumento). Si MAX_WORKERS funciones bloquean a la vez (lecturas GPIB lentas, callbacks que
+    esperan), los plazos vencidos del resto de delays se retrasan hasta que quede un hilo libre.
+    """
+
+    MAX_WORKERS = 4
+
+    def __init__(self):
+        self._heap = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._thread = None
+        self._executor = None
+
+    def call_later(self, delay: float, fn: Callable, *args) -> _ScheduledCall:
+        """Programa `fn(*args)` dentro de `delay` segundos. Devuelve la entrada (con `cancel()`)."""
+        return self.call_at(time.monotonic() + max(0.0, delay), fn, *args)
+
+    def call_at(self, deadline: float, fn: Callable, *args) -> _ScheduledCall:
+        """Programa `fn(*args)` en el instante absoluto `deadline` (reloj time.monotonic)."""
+        entry = _ScheduledCall(deadline, next(self._seq), fn, args)
+        with self._cond:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                                    thread_name_prefix="delay-callback")
+                self._thread = threading.Thread(target=self._run, name="delay-scheduler", daemon=True)
+                self._thread.start()
+            heapq.heappush(self._heap, entry)
+            if self._heap[0] is entry:
+                self._cond.notify()  # nuevo plazo más próximo: el hilo debe recalcular su espera
+        return entry
+
+    def _run(self):
+        heap = self._heap
+        cond = self._cond
+        submit = self._executor.submit
+        clock = time.monotonic
+        pop = heapq.heappop
+        with cond:
+            while True:
+                # Una sola lectura del reloj por despertar: se sacan todas las entradas vencidas
+                now = clock()
+                while heap and (heap[0].cancelled or heap[0].deadline <= now):
+                    entry = pop(heap)
+                    if not entry.cancelled:
+                        submit(entry.fn, *entry.args).add_done_callback(_log_failure)
+                if not heap:
+                    cond.wait()
+                else:
+                    cond.wait(heap[0].deadline - now)
+
+
+def _log_failure(future) -> None:
+    """Registra la excepción de una función del planificador (el executor la descartaría en silencio)."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Error en una función programada de delay", exc_info=exc)
+
+
+_scheduler = _Scheduler()
 
 
 class TimeDelay(Delay):
-    __version__ = "1.0.5"
+    __version__ = "1.2.0"
     """
     Implementa un temporizador configurable con soporte para pausa, reanudación,
     reinicio y ejecución repetida mediante un número definido de disparos (n_shots).
 
-    Esta clase encapsula un `threading.Timer` y añade control de estado, permitiendo
-    iniciar, pausar, reanudar o reiniciar el temporizador sin perder el tiempo restante.
+    Esta clase no crea hilos propios: cada disparo se programa en el planificador compartido
+    del módulo (`_scheduler`), un único hilo para todos los TimeDelay activos. Añade control de
+    estado, permitiendo iniciar, pausar, reanudar o reiniciar el temporizador sin perder el
+    tiempo restante. Pausar cancela el plazo programado y reanudar programa uno nuevo.
     Puede ejecutar una función de callback al finalizar cada disparo o solo al completar
     el último, dependiendo del flujo configurado.
 
@@ -98,9 +215,8 @@ class TimeDelay(Delay):
         callback (Callable | None): Función que se ejecuta al finalizar el último disparo.
         n_shots (int): Número total de disparos del temporizador. Si es <= 0, se fuerza a 1.
         remaining_shots (int): Disparos restantes antes de finalizar el ciclo completo.
-        timer (threading.Timer): Instancia interna del temporizador.
-        startedTime (float | None): Marca temporal del inicio del último disparo.
-        pausedTime (float | None): Marca temporal del momento en que se pausó.
+        startedTime (float | None): Marca temporal (time.monotonic) del último start.
+        pausedTime (float | None): Marca temporal (time.monotonic) del momento en que se pausó.
         state (str): Estado actual del temporizador.
 
     Métodos principales:
@@ -141,7 +257,11 @@ class TimeDelay(Delay):
         >>> # Tras 6 segundos aprox. se imprimirá "¡Finalizado!"
     """
 
-    def __init__(self, timeout=1.0, callback=None, n_shots=1):
+    __slots__ = ('timeout', 'callback', 'n_shots', 'remaining_shots', 'startedTime', 'pausedTime',
+                 'state', '_clock', '_shot_left', '_deadline', '_done_event', '_lock', '_timer',
+                 '_generation', '_total', '_pending')
+
+    def __init__(self, timeout=1.0, callback=None, n_shots=1, clock: Callable[[], float] = time.monotonic):
         """
         Inicializa el temporizador.
 
@@ -149,52 +269,60 @@ class TimeDelay(Delay):
             timeout (float): Tiempo de cada disparo en segundos.
             callback (Callable | None): Función que se ejecuta al finalizar el último disparo.
             n_shots (int): Número total de disparos del temporizador.
+            clock (Callable[[], float]): Reloj monotónico en segundos. Por defecto time.monotonic;
+                los tests pueden inyectar un reloj falso para no depender de sleeps.
         """
         self.timeout = timeout
+        self._clock = clock
         self.callback = callback
         self.n_shots = n_shots
         if not self.n_shots or self.n_shots < 0:
             self.n_shots = 1
         self.remaining_shots = self.n_shots
-        self.timer = threading.Timer(timeout, self._internal_callback)
+        self._total = self.timeout * self.n_shots  # duración total, fija tras construir
+        self._pending = self.timeout * (self.n_shots - 1)  # tiempo de los disparos aún no empezados
         self.startedTime = None  # solo para iniciar
         self.pausedTime = None  # solo para iniciar
+        self._shot_left = timeout  # tiempo pendiente del disparo actual mientras no está en marcha
+        self._deadline = None  # instante (monotonic) en que vence el disparo en curso
         self.state = DelayState.INITIATED
+        self._done_event = threading.Event()  # se activa al completar todos los disparos
+        # Protege el estado frente al hilo del planificador
+        self._lock = threading.Lock()
+        self._timer = None  # plazo programado en el planificador (None si no está en marcha)
+        # pause/reset invalidan el plazo en vuelo: solo actúa el de la generación actual
+        self._generation = 0
 
     def start(self):
         """
         Inicia el temporizador o lo reanuda si estaba pausado.
         Si el temporizador estaba en estado 'done', se reinicia antes de iniciar.
         """
-        if self.state == DelayState.STARTED: return
-        if self.state in (DelayState.INITIATED, DelayState.PAUSED, DelayState.DONE):
-            if self.state == DelayState.PAUSED:
-                self.timer = threading.Timer(
-                    self.timeout - (self.pausedTime - self.startedTime),
-                    self._internal_callback)
-            if self.state == DelayState.DONE:
+        with self._lock:
+            if self.state is DelayState.STARTED: return
+            if self.state is DelayState.DONE:
                 # si el timer ha finalizado entonces debemos rehacerlo antes de volver a hacer un start
-                self.reset()
-            self.state = DelayState.STARTED
-            self.startedTime = time.time()
-            self.timer.start()
+                self._rearm()
+            self._run_shot()
 
     def pause(self):
         """
         Pausa el temporizador, conservando el tiempo restante y transcurrido.
         """
-        if not self.state == DelayState.STARTED: return
-        self.state = DelayState.PAUSED
-        self.timer.cancel()
-        self.pausedTime = time.time()
+        with self._lock:
+            if self.state is not DelayState.STARTED: return
+            self.state = DelayState.PAUSED
+            self.pausedTime = self._clock()
+            self._shot_left = max(0.0, self._deadline - self.pausedTime)
+            self._cancel()
 
     def resume(self):
         """
         Reanuda el temporizador desde donde se pausó.
         """
-        if not self.state == DelayState.PAUSED:
-            return
-        self.start()
+        with self._lock:
+            if self.state is DelayState.PAUSED:
+                self._run_shot()
 
     def reset(self):
         """
@@ -203,8 +331,8 @@ class TimeDelay(Delay):
         Restablece remaining_shots al número original de disparos y rearma
         el temporizador. No inicia automáticamente; es necesario llamar a start().
         """
-        self.remaining_shots = self.n_shots
-        self._rearm()  # Rearma el temporizador
+        with self._lock:
+            self._rearm()  # Rearma el temporizador
 
     def is_done(self) -> bool:
         """
@@ -213,7 +341,20 @@ class TimeDelay(Delay):
         Returns:
             bool: True si el temporizador está en estado 'done'.
         """
-        return self.state == DelayState.DONE
+        # El evento se activa tras el callback del último disparo (ver _on_shot)
+        return self._done_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera (sin consumir CPU) a que el temporizador complete todos los disparos.
+
+        Args:
+            timeout (float | None): Tiempo máximo de espera en segundos. None espera indefinidamente.
+
+        Returns:
+            bool: True si el temporizador ha terminado, False si venció `timeout`.
+        """
+        return self._done_event.wait(timeout)
 
     def elapsed(self):
         """
@@ -223,7 +364,7 @@ class TimeDelay(Delay):
         Returns:
             float: Tiempo transcurrido en segundos.
         """
-        return self.timeout * self.n_shots - self.remaining()
+        return self._total - self.remaining()
 
     def remaining(self):
         """
@@ -232,47 +373,84 @@ class TimeDelay(Delay):
         Returns:
             float: Tiempo restante en segundos.
         """
-        if not self.startedTime:
-            return self.timeout * self.n_shots
-        else:
-            # se ha iniciado alguna vez el timer
-            if not self.pausedTime:
-                # pero nunca se ha pausado
-                # (self.timeout - (time.time() - self.startedTime) es el tiempo que queda de un timeout
-                return self.timeout * self.remaining_shots + (self.timeout - (time.time() - self.startedTime))
+        with self._lock:
+            if self.state is DelayState.DONE:
+                return 0.0
+            if self.state is DelayState.STARTED:
+                shot_left = max(0.0, self._deadline - self._clock())
             else:
-                # se ha iniciado y se ha pausado alguna vez el timer
-                return self.timeout * self.remaining_shots + (self.timeout - (self.pausedTime - self.startedTime))
-
-    def _internal_callback(self):
+                shot_left = self._shot_left
+            # los disparos pendientes incluyen el actual
+            return self._pending + shot_left
+
+    def _run_shot(self):
+        """Pone en marcha el disparo actual con el tiempo que le queda (con `_lock` adquirido)."""
+        self.state = DelayState.STARTED
+        # Un único plazo absoluto: remaining() lo compara con el reloj, sin acumular tiempos
+        self.startedTime = self._clock()
+        self._deadline = self.startedTime + self._shot_left
+        self._schedule(self._shot_left)
+
+    def _schedule(self, delay):
+        """Programa el siguiente vencimiento en el planificador (con `_lock` adquirido)."""
+        self._timer = _scheduler.call_later(delay, self._on_shot, self._generation)
+
+    def _cancel(self):
+        """Anula el vencimiento programado (con `_lock` adquirido)."""
+        self._generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_shot(self, generation):
         """
-        Callback interno llamado por threading.Timer al expirar cada disparo.
+        Vencimiento de un disparo (hilo del planificador).
 
-        Reduce remaining_shots y, si no ha terminado, rearma y reinicia el timer.
-        Llama a la función callback del usuario si se completan todos los disparos.
+        Encadena el siguiente disparo o, tras el último, marca 'done' y llama al callback del
+        usuario (fuera del lock). Un vencimiento de una generación anterior se ignora.
         """
-        self.remaining_shots = self.remaining_shots - 1
-        if self.remaining_shots == 0:
+        with self._lock:
+            if self._generation != generation or self.state is not DelayState.STARTED:
+                return
+            now = self._clock()
+            left = self._deadline - now
+            if left > 0:
+                self._schedule(left)  # el reloj inyectado aún no ha llegado al plazo
+                return
+            self.remaining_shots = self.remaining_shots - 1
+            if self.remaining_shots > 0:
+                self._pending = self.timeout * (self.remaining_shots - 1)  # una vez por disparo
+                # siguiente disparo encadenado al plazo anterior (sin deriva acumulada)
+                self.startedTime = self._deadline
+                self._deadline = self._deadline + self.timeout
+                self._schedule(self._deadline - now)
+                return
+            self._timer = None
             self.state = DelayState.DONE
-        else:
-            # aqui, rearmar el timer y hacer un start
-            self._rearm()
-            self.start()
-        # if self.state = 'done'
-        if self.state == DelayState.DONE and self.callback:
-            self.callback()
+        try:
+            if self.callback:
+                self.callback()
+        finally:
+            # después del callback (aunque falle): quien espera en wait() ve también sus efectos
+            with self._lock:
+                if self._generation == generation:  # salvo que el callback haya hecho reset/start
+                    self._done_event.set()
 
     def _rearm(self):
         """
-        Rearma el temporizador sin reinicializar todo el objeto.
+        Rearma el temporizador sin reinicializar todo el objeto (con `_lock` adquirido).
 
-        Cancela cualquier timer activo y prepara uno nuevo.
+        Cancela el plazo programado y deja el estado inicial.
         """
-        if self.timer.is_alive(): self.timer.cancel()
-        self.timer = threading.Timer(self.timeout, self._internal_callback)
+        self._cancel()
+        self.remaining_shots = self.n_shots
+        self._pending = self._total - self.timeout
         self.startedTime = None
         self.pausedTime = None
+        self._shot_left = self.timeout
+        self._deadline = None
         self.state = DelayState.INITIATED
+        self._done_event.clear()
 
     def __str__(self):
         """
@@ -282,27 +460,39 @@ class TimeDelay(Delay):
             str: Información resumida del temporizador.
         """
         callback_name = getattr(self.callback, '__name__', repr(self.callback))
+        remaining = self.remaining()  # una sola lectura del reloj para ambos campos
+        elapsed = self._total - remaining
         return (f"TimeDelay(timeout={self.timeout:.2f}s, state='{self.state.value}', "
-                f"elapsed={self.elapsed():.2f}s, remaining={self.remaining():.2f}s, "
+                f"elapsed={elapsed:.2f}s, remaining={remaining:.2f}s, "
                 f"callback={callback_name}, n_shots={self.n_shots})")
 
 
 class StatisticsDelay(Delay):
-    __version__ = "1.0.3"
+    __version__ = "1.2.0"
+    WINDOW_SIZE = 120
 
     """
     Clase que implementa un delay basado en estadísticas sobre valores leídos periódicamente.
 
     Cada cierto intervalo de tiempo (timer_interval), se lee un valor usando la función
-    inyectada `read_value()`. Se calcula una métrica (último valor, media o desviación estándar)
+    inyectada `read_value()`. Cada tick se programa en el planificador compartido del módulo
+    (`_scheduler`), sin hilos propios; pause/reset cancelan el tick pendiente. Se calcula una métrica (último valor, media o desviación estándar)
     y se compara con un valor de referencia usando un comparador (mayor, menor, igual).
 
     Si la condición se cumple, se ejecuta el callback y opcionalmente se limpia la lista de valores.
+    Si `read_value()` o el cálculo de la métrica lanzan una excepción, se registra en el log, el
+    delay termina en estado 'error' (con la excepción en `error`, sin llamar al callback) y `wait()`
+    deja de esperar.
 
-    La lista de valores mantiene como máximo los últimos 120 elementos usando `LimitedList`.
+    La ventana de valores mantiene como máximo los últimos 120 elementos en una
+    `RollingWindow`: añadir, descartar el más antiguo y calcular media/desviación es O(1).
     Todas las operaciones sobre la lista son thread-safe gracias a un lock interno.
     """
 
+    __slots__ = ('reference_value', 'metric', 'comparator', 'timer_interval', 'callback', 'read_value',
+                 '_metric_fn', '_compare', 'values', '_timer', '_generation', '_next_tick', 'started_time',
+                 'paused_time', 'elapsed_time', 'state', 'error', '_done_event', '_state_lock')
+
     # TODO: para el caso de metricas como stdev, mean hay que asegurar que el delay comparé solo a partir de n numero, para evitar un match prematuro
     def __init__(self,
                  reference_value: float,
@@ -329,51 +519,58 @@ class StatisticsDelay(Delay):
         self.timer_interval = timer_interval
         self.callback = callback
         self.read_value = read_value  # inyección de dependencia
-
-        self.values = None  # lista de valores con longitud máxima 120
-        self.timer = TimeDelay(self.timer_interval, self._timer_task, )
+        # Métrica y comparador resueltos una sola vez a funciones (sin despacho por enum en cada tick)
+        self._metric_fn = my_statistics.metric_function(metric)
+        self._compare = my_statistics.comparator_function(comparator)
+
+        self.values = None  # ventana de valores con longitud máxima WINDOW_SIZE
+        self._timer = None  # tick pendiente en el planificador
+        self._next_tick = None  # instante (monotonic) del siguiente tick, a ritmo fijo
+        # pause/reset invalidan el tick en vuelo: solo actúa el de la generación actual
+        self._generation = 0
         self.started_time = None
         self.paused_time = None
         self.elapsed_time = 0.0
-        self.state = 'initiated'
+        self.state = DelayState.INITIATED
+        self.error = None  # excepción de read_value si el delay terminó en 'error'
+        self._done_event = threading.Event()  # se activa cuando se cumple la condición (o en 'error')
 
-        # Lock para operaciones thread-safe sobre la lista
-        self._values_lock = threading.Lock()
+        # Un único lock protege la ventana y serializa start/pause/reset/tick
+        self._state_lock = threading.Lock()
 
     def start(self):
         """
         Inicia el timer y comienza a leer valores periódicamente.
         :return: None
         """
-        if self.state == 'initiated' or self.state == 'paused' or self.state == 'continue':
-            if self.state == 'paused':
-                self.timer.resume()
-            elif self.state == 'initiated':
-                self.values = LimitedList(120)  # lista de valores con longitud máxima 120
-                self.timer.start()
-            elif self.state == 'continue':
-                self.timer.reset()
-                self.timer.start()
-            self.state = 'started'
-            self.started_time = time.time()
+        with self._state_lock:
+            if self.state is not DelayState.INITIATED and self.state is not DelayState.PAUSED:
+                return
+            if self.values is None:
+                self.values = my_statistics.RollingWindow(self.WINDOW_SIZE)
+            self.state = DelayState.STARTED
+            self.started_time = time.monotonic()
+            self._next_tick = self.started_time + self.timer_interval
+            self._schedule()
 
     def pause(self):
         """
         Pone el timer en modo pause conservando los valores de elapsed time.
         :return: None
         """
-        if not self.state == 'started':
-            return
-        self.timer.pause()
-        self.elapsed_time = self.elapsed_time + (time.time() - self.started_time)
-        self.state = 'paused'
+        with self._state_lock:
+            if self.state is not DelayState.STARTED:
+                return
+            self._cancel()
+            self.elapsed_time = self.elapsed_time + (time.monotonic() - self.started_time)
+            self.state = DelayState.PAUSED
 
     def resume(self):
         """
         Reanuda el timer si es que previamente se había ejecutado pause.
         :return: None
         """
-        if not self.state == 'paused':
+        if self.state is not DelayState.PAUSED:
             return
         self.start()
 
@@ -385,17 +582,32 @@ class StatisticsDelay(Delay):
         Es necesario volver a hacer un start del timer.
         :return: None
         """
-        self.timer.reset()
-        self.__init__(self.reference_value,
-                      self.metric,
-                      self.comparator,
-                      self.timer_interval,
-                      self.read_value,
-                      self.callback
-                      )
+        # Todo en sitio (sin volver a llamar a __init__): el lock y el evento son los mismos
+        # objetos, así que quien ya espera en wait() se despierta al terminar la siguiente ejecución.
+        with self._state_lock:
+            self._cancel()  # nueva generación: un tick anterior al reset no debe coincidir
+            if self.values is not None:
+                # Se reutiliza la ventana: clear() en sitio en lugar de crear otra en el siguiente start()
+                self.values.clear()
+            self._next_tick = None
+            self.started_time = None
+            self.paused_time = None
+            self.elapsed_time = 0.0
+            self.state = DelayState.INITIATED
+            self.error = None
+            self._done_event.clear()
 
     def is_done(self) -> bool:
-        return self.state == 'done'
+        # El evento se activa en _tick a la vez que el estado pasa a 'done' (o a 'error')
+        return self._done_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera (sin consumir CPU) a que se cumpla la condición estadística.
+        :param timeout: Tiempo máximo de espera en segundos. None espera indefinidamente.
+        :return: True si el delay ha terminado, False si venció `timeout`.
+        """
+        return self._done_event.wait(timeout)
 
     def elapsed(self) -> float:
         """
@@ -406,32 +618,85 @@ class StatisticsDelay(Delay):
 
     def remaining(self) -> float:
         """
-        En este tipo de timer el metodo remaining no tiene sentido.
-        """
-        pass
-
-    def _timer_task(self) -> None:
-        """
-        Función interna llamada por el timer en cada tick.
-        - Añade un valor a la lista de forma thread-safe.
-        - Calcula la métrica seleccionada.
-        - Comprueba si la condición se cumple usando el comparador.
-        - Ejecuta el callback si se cumple y limpia la lista de valores.
-        - Reinicia el timer si no se cumple la condición.
-        """
-        with self._values_lock:
-            self.values.append(self.read_value())
-            trigger = my_statistics.check_match(
-                my_statistics.compute_metric(self.values, self.metric),
-                self.comparator,
-                self.reference_value
-            )
-        if trigger:
-            self.state = 'done'
-            self._internal_callback()
-        else:
-            self.state = 'continue'
-            self.start()
+        El final de este delay depende de los valores leídos, así que no hay un tiempo restante total.
+        Devuelve el tiempo (en segundos) hasta el siguiente tick, que es cuando puede cumplirse la
+        condición: 0 si ya ha terminado ('done' o 'error') y `timer_interval` si no está en marcha.
+        """
+        with self._state_lock:
+            if self.state is DelayState.DONE or self.state is DelayState.ERROR:
+                return 0.0
+            if self.state is not DelayState.STARTED:
+                return self.timer_interval
+            return max(0.0, self._next_tick - time.monotonic())
+
+    def _schedule(self) -> None:
+        """Programa el tick de `_next_tick` (con `_state_lock` adquirido)."""
+        self._timer = _scheduler.call_at(self._next_tick, self._tick, self._generation)
+
+    def _cancel(self) -> None:
+        """Anula el tick pendiente (con `_state_lock` adquirido)."""
+        self._generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _tick(self, generation) -> None:
+        """
+        Un tick (hilo del planificador): lee un valor, lo añade a la ventana, calcula la métrica y
+        la compara con la referencia. Si no se cumple, programa el siguiente tick.
+
+        La lectura se hace fuera de los locks (puede ser E/S lenta); un tick de una generación
+        anterior (tras pause/reset) descarta su lectura.
+        """
+        if self._generation != generation:
+            return
+        try:
+            value = self.read_value()
+        except Exception as exc:
+            with self._state_lock:
+                if self._generation == generation:
+                    self._fail(exc)
+            return
+        with self._state_lock:
+            if self._generation != generation:
+                return
+            try:
+                values = self.values
+                values.append(value)
+                metric = self._metric_fn(values)
+                # como check_match: una métrica None (sin datos) no cumple la condición
+                triggered = metric is not None and self._compare(metric, self.reference_value)
+            except Exception as exc:
+                self._fail(exc)
+                return
+            if not triggered:
+                # Ritmo fijo: el siguiente plazo se encadena al anterior, así la duración de
+                # read_value no se acumula como deriva. Si un tick se ha retrasado más de un
+                # intervalo, se saltan los perdidos en lugar de dispararlos en ráfaga.
+                next_tick = self._next_tick + self.timer_interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick = now + self.timer_interval
+                self._next_tick = next_tick
+                self._schedule()
+                return
+            self._timer = None
+            self.state = DelayState.DONE
+            self._done_event.set()
+        self._internal_callback()
+
+    def _fail(self, exc: Exception) -> None:
+        """
+        Termina el delay en 'error' (con `_state_lock` adquirido). Sin lectura o sin métrica no hay
+        forma de evaluar la condición: se despierta a quien espera en wait() en lugar de dejar el
+        delay 'started' para siempre.
+        """
+        logger.error("StatisticsDelay: fallo al evaluar el tick; el delay termina en estado 'error'",
+                     exc_info=exc)
+        self._timer = None
+        self.error = exc
+        self.state = DelayState.ERROR
+        self._done_event.set()
 
     def _internal_callback(self):
         if self.callback:
@@ -443,7 +708,7 @@ class StatisticsDelay(Delay):
 
         Esto puede usarse para reiniciar manualmente la ventana de valores.
         """
-        with self._values_lock:
+        with self._state_lock:
             self.values.clear()
 
     def __str__(self):
@@ -456,11 +721,349 @@ class StatisticsDelay(Delay):
                 f"  Metric          : {self.metric.name if hasattr(self.metric, 'name') else self.metric}\n"
                 f"  Comparator      : {self.comparator.name if hasattr(self.comparator, 'name') else self.comparator}\n"
                 f"  Timer interval  : {self.timer_interval}s\n"
-                f"  State           : {self.state}\n"
+                f"  State           : {self.state.value}\n"
                 f"  Elapsed time    : {self.elapsed_time:.3f}s\n"
                 f"  Values count    : {len(self.values) if self.values else 0}\n"
                 f"  Callback defined: {'Yes' if self.callback else 'No'}")
 
+class AsyncTimeDelay(Delay):
+    __version__ = "1.0.0"
+    """
+    Variante de `TimeDelay` para aplicaciones que ya tienen un event loop de asyncio.
+
+    No crea hilos: cada disparo se programa con `loop.call_at` en el heap del propio loop, de modo
+    que cualquier número de delays se atiende desde el hilo del loop. Mantiene la misma semántica
+    que `TimeDelay` (n_shots, pausa conservando el tiempo restante, reset, callback al final).
+
+    start/pause/resume/reset deben llamarse desde el hilo del event loop (call_at no es thread-safe).
+    `wait()` bloquea el hilo llamante y solo debe usarse desde otro hilo; dentro del loop se usa
+    `await delay.wait_async()`.
+
+    Ejemplo:
+        >>> async def main():
+        ...     d = AsyncTimeDelay(timeout=0.5, callback=lambda: print("fin"))
+        ...     d.start()
+        ...     await d.wait_async()
+        >>> asyncio.run(main())
+    """
+
+    __slots__ = ('timeout', 'callback', 'n_shots', 'remaining_shots', 'startedTime', 'pausedTime',
+                 'state', '_loop', '_shot_left', '_deadline', '_handle', '_done_event', '_done_waiters')
+
+    def __init__(self, timeout=1.0, callback=None, n_shots=1, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Inicializa el temporizador.
+
+        Args:
+            timeout (float): Tiempo de cada disparo en segundos.
+            callback (Callable | None): Función que se ejecuta al finalizar el último disparo.
+            n_shots (int): Número total de disparos del temporizador.
+            loop (asyncio.AbstractEventLoop | None): Event loop a usar. Si es None se toma el loop
+                en ejecución en el primer start().
+        """
+        self.timeout = timeout
+        self.callback = callback
+        self.n_shots = n_shots
+        if not self.n_shots or self.n_shots < 0:
+            self.n_shots = 1
+        self._loop = loop
+        self.remaining_shots = self.n_shots
+        self.startedTime = None
+        self.pausedTime = None
+        self._shot_left = timeout
+        self._deadline = None  # instante (loop.time()) en que vence el disparo en curso
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self.state = DelayState.INITIATED
+        self._done_event = threading.Event()  # para wait() desde otros hilos
+        self._done_waiters = []  # futures de wait_async() pendientes
+
+    def start(self):
+        """
+        Inicia el temporizador o lo reanuda si estaba pausado.
+        Si el temporizador estaba en estado 'done', se reinicia antes de iniciar.
+        """
+        if self.state is DelayState.STARTED: return
+        if self.state is DelayState.DONE:
+            self.reset()
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        self.state = DelayState.STARTED
+        self.startedTime = self._loop.time()
+        self._deadline = self.startedTime + self._shot_left
+        self._handle = self._loop.call_at(self._deadline, self._on_shot)
+
+    def pause(self):
+        """
+        Pausa el temporizador, conservando el tiempo restante y transcurrido.
+        """
+        if self.state is not DelayState.STARTED: return
+        self._handle.cancel()
+        self._handle = None
+        self.state = DelayState.PAUSED
+        self.pausedTime = self._loop.time()
+        self._shot_left = max(0.0, self._deadline - self.pausedTime)
+
+    def resume(self):
+        """
+        Reanuda el temporizador desde donde se pausó.
+        """
+        if self.state is not DelayState.PAUSED:
+            return
+        self.start()
+
+    def reset(self):
+        """
+        Reinicia el temporizador a los valores iniciales. No inicia automáticamente.
+        Cancela las esperas de wait_async() pendientes.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self.remaining_shots = self.n_shots
+        self.startedTime = None
+        self.pausedTime = None
+        self._shot_left = self.timeout
+        self._deadline = None
+        self.state = DelayState.INITIATED
+        self._done_event.clear()
+        # como en AsyncStatisticsDelay: las esperas pendientes no se resolverían hasta un nuevo start()
+        waiters, self._done_waiters = self._done_waiters, []
+        for fut in waiters:
+            fut.cancel()
+
+    def is_done(self) -> bool:
+        return self.state is DelayState.DONE
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera desde otro hilo a que el temporizador complete todos los disparos.
+        No debe llamarse desde el hilo del event loop (lo bloquearía); allí se usa wait_async().
+        """
+        return self._done_event.wait(timeout)
+
+    async def wait_async(self) -> None:
+        """
+        Espera (sin bloquear el loop) a que el temporizador complete todos los disparos.
+        Lanza CancelledError si el temporizador se reinicia con reset() antes de terminar.
+        """
+        if self.state is DelayState.DONE:
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._done_waiters.append(fut)
+        await fut
+
+    def elapsed(self):
+        return self.timeout * self.n_shots - self.remaining()
+
+    def remaining(self):
+        if self.state is DelayState.DONE:
+            return 0.0
+        if self.state is DelayState.STARTED:
+            shot_left = max(0.0, self._deadline - self._loop.time())
+        else:
+            shot_left = self._shot_left
+        return self.timeout * (self.remaining_shots - 1) + shot_left
+
+    def _on_shot(self):
+        """
+        Callback del loop al vencer un disparo: encadena el siguiente o finaliza.
+        """
+        self.remaining_shots = self.remaining_shots - 1
+        if self.remaining_shots > 0:
+            # siguiente disparo encadenado al plazo anterior (sin deriva acumulada)
+            self.startedTime = self._deadline
+            self._deadline = self._deadline + self.timeout
+            self._handle = self._loop.call_at(self._deadline, self._on_shot)
+            return
+        self._handle = None
+        self.state = DelayState.DONE
+        self._done_event.set()
+        waiters, self._done_waiters = self._done_waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+        if self.callback:
+            self.callback()
+
+    def __str__(self):
+        callback_name = getattr(self.callback, '__name__', repr(self.callback))
+        remaining = self.remaining()  # una sola lectura del reloj para ambos campos
+        elapsed = self.timeout * self.n_shots - remaining
+        return (f"AsyncTimeDelay(timeout={self.timeout:.2f}s, state='{self.state.value}', "
+                f"elapsed={elapsed:.2f}s, remaining={remaining:.2f}s, "
+                f"callback={callback_name}, n_shots={self.n_shots})")
+
+
+class AsyncStatisticsDelay(Delay):
+    __version__ = "1.0.0"
+    WINDOW_SIZE = StatisticsDelay.WINDOW_SIZE
+    """
+    Variante de `StatisticsDelay` para aplicaciones con event loop de asyncio.
+
+    Cada tick es `await asyncio.sleep(timer_interval)` dentro de una única tarea del loop, sin hilos
+    ni locks: la ventana solo se toca desde el hilo del loop. `read_value` debe ser rápida (no
+    bloqueante); una lectura de instrumento lenta bloquearía el loop entero.
+
+    start/pause/resume/reset deben llamarse desde el hilo del event loop. Dentro del loop se espera
+    con `await delay.wait_async()`; `wait()` es para otros hilos. Al igual que en `StatisticsDelay`,
+    si `read_value()` lanza una excepción el delay termina en estado 'error' (excepción en `error`).
+    Un reset() con esperas de wait_async() pendientes las cancela.
+    """
+
+    __slots__ = ('reference_value', 'metric', 'comparator', 'timer_interval', 'callback', 'read_value',
+                 '_metric_fn', '_compare', 'values', '_task', 'started_time', 'elapsed_time', 'state',
+                 '_done_event', '_done_waiters', '_next_tick', 'error')
+
+    def __init__(self,
+                 reference_value: float,
+                 metric: my_statistics.Metrics,
+                 comparator: my_statistics.Comparator,
+                 timer_interval: float,
+                 read_value: Callable[[], float],
+                 callback: Optional[Callable[[], None]] = None
+                 ):
+        """
+        Mismos argumentos que `StatisticsDelay`.
+        """
+        self.reference_value = reference_value
+        self.metric = metric
+        self.comparator = comparator
+        self.timer_interval = timer_interval
+        self.callback = callback
+        self.read_value = read_value
+        self._metric_fn = my_statistics.metric_function(metric)
+        self._compare = my_statistics.comparator_function(comparator)
+        self.values = None
+        self._task: Optional[asyncio.Task] = None
+        self.started_time = None
+        self.elapsed_time = 0.0
+        self.state = DelayState.INITIATED
+        self._done_event = threading.Event()
+        self._done_waiters = []
+        self._next_tick = None  # instante (loop.time()) del siguiente tick
+        self.error = None  # excepción de read_value si el delay terminó en 'error'
+
+    def start(self):
+        if self.state is not DelayState.INITIATED and self.state is not DelayState.PAUSED:
+            return
+        loop = asyncio.get_running_loop()
+        if self.values is None:
+            self.values = my_statistics.RollingWindow(self.WINDOW_SIZE)
+        self.state = DelayState.STARTED
+        self.started_time = loop.time()
+        self._next_tick = self.started_time + self.timer_interval
+        self._task = loop.create_task(self._run())
+
+    def pause(self):
+        if self.state is not DelayState.STARTED:
+            return
+        self._task.cancel()
+        self._task = None
+        self.elapsed_time = self.elapsed_time + (asyncio.get_running_loop().time() - self.started_time)
+        self.state = DelayState.PAUSED
+
+    def resume(self):
+        if self.state is not DelayState.PAUSED:
+            return
+        self.start()
+
+    def reset(self):
+        """
+        Detiene la tarea y vuelve al estado inicial, vaciando la ventana. Es necesario volver a hacer start().
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.values is not None:
+            self.values.clear()
+        self.started_time = None
+        self.elapsed_time = 0.0
+        self._next_tick = None
+        self.state = DelayState.INITIATED
+        self.error = None
+        self._done_event.clear()
+        # las esperas pendientes no volverían a resolverse hasta un nuevo start(): se cancelan
+        waiters, self._done_waiters = self._done_waiters, []
+        for fut in waiters:
+            fut.cancel()
+
+    def is_done(self) -> bool:
+        return self._done_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera desde otro hilo a que se cumpla la condición (no llamar desde el hilo del loop).
+        """
+        return self._done_event.wait(timeout)
+
+    async def wait_async(self) -> None:
+        """
+        Espera (sin bloquear el loop) a que se cumpla la condición estadística.
+        Lanza CancelledError si el delay se reinicia con reset() antes de terminar.
+        """
+        if self._done_event.is_set():
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._done_waiters.append(fut)
+        await fut
+
+    def elapsed(self) -> float:
+        return self.elapsed_time
+
+    def remaining(self) -> float:
+        """
+        Igual que `StatisticsDelay.remaining`: tiempo (en segundos) hasta el siguiente tick,
+        0 si ya ha terminado ('done' o 'error') y `timer_interval` si no está en marcha.
+        """
+        if self.state is DelayState.DONE or self.state is DelayState.ERROR:
+            return 0.0
+        if self.state is not DelayState.STARTED:
+            return self.timer_interval
+        return max(0.0, self._next_tick - self._task.get_loop().time())
+
+    def _finish(self, state: DelayState) -> None:
+        """Termina el delay en `state` y despierta a todos los que esperan."""
+        self._task = None
+        self._next_tick = None
+        self.state = state
+        self._done_event.set()
+        waiters, self._done_waiters = self._done_waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        sleep = asyncio.sleep
+        interval = self.timer_interval
+        read = self.read_value
+        values = self.values
+        append = values.append
+        metric = self._metric_fn
+        compare = self._compare
+        reference = self.reference_value
+        try:
+            while True:
+                await sleep(interval)
+                append(read())
+                if compare(metric(values), reference):
+                    break
+                self._next_tick = loop.time() + interval
+        except Exception as exc:
+            logger.error("AsyncStatisticsDelay: fallo en read_value; el delay termina en estado 'error'",
+                         exc_info=exc)
+            self.error = exc
+            self._finish(DelayState.ERROR)
+            return
+        # como en AsyncTimeDelay, el delay queda terminado antes de llamar al callback
+        self._finish(DelayState.DONE)
+        if self.callback:
+            try:
+                self.callback()
+            except Exception:
+                logger.exception("AsyncStatisticsDelay: el callback ha lanzado una excepción")
+
+
 # 🧪 Ejemplo de registro dinámico
 #
 # Supón que creas un nuevo tipo de delay:
@@ -1,4 +1,7 @@
+import math
+import operator
 import statistics
+from collections import deque
 from enum import Enum
 
 class Metrics(Enum):
@@ -13,18 +16,105 @@ class Comparator(Enum):
     LESS_THAN = "less_than"
     EQUAL_TO = "equal_to"
 
+class RollingWindow:
+    __version__ = "1.1.0"
+    """
+    Ventana deslizante de los últimos `maxlen` valores con media y desviación estándar en O(1).
+
+    Mantiene la suma de la ventana y la suma de cuadrados de las desviaciones (M2, Welford)
+    actualizadas al añadir un valor y al descartar el más antiguo, de modo que `mean()` y
+    `stdev()` no recorren la ventana. Se indexa e itera como una lista.
+
+    Las actualizaciones incrementales acumulan error de redondeo en ejecuciones largas; cada
+    `RESYNC_EVERY` valores se recalculan suma y M2 de forma exacta sobre la ventana (O(n) amortizado
+    a casi nada por valor).
+    """
+
+    RESYNC_EVERY = 10_000
+
+    def __init__(self, maxlen: int):
+        self._values = deque(maxlen=maxlen)
+        self._sum = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    def append(self, value: float) -> None:
+        values = self._values
+        if len(values) == values.maxlen:
+            # Welford inverso: se retira el más antiguo antes de añadir el nuevo
+            old = values.popleft()
+            n = len(values)
+            old_mean = self._sum / (n + 1)
+            self._sum -= old
+            new_mean = self._sum / n if n else 0.0
+            self._m2 -= (old - old_mean) * (old - new_mean)
+        n = len(values)
+        old_mean = self._sum / n if n else 0.0
+        self._sum += value
+        self._m2 += (value - old_mean) * (value - self._sum / (n + 1))
+        values.append(value)
+        self._since_resync += 1
+        if self._since_resync >= self.RESYNC_EVERY:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recalcula suma y M2 en dos pasadas (math.fsum) para descartar la deriva acumulada."""
+        values = self._values
+        self._sum = math.fsum(values)
+        mean = self._sum / len(values)
+        self._m2 = math.fsum((v - mean) ** 2 for v in values)
+        self._since_resync = 0
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._sum = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+
+    def mean(self) -> float:
+        return self._sum / len(self._values)
+
+    def stdev(self) -> float:
+        """Desviación estándar muestral (como statistics.stdev); 0.0 con menos de dos valores."""
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / (n - 1))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"RollingWindow({list(self._values)}, maxlen={self._values.maxlen})"
+
+
 def compute_metric(values: list, metric: Metrics):
     __version__ = "1.0.0"
     """Calcula el valor que se usará para comparar con la referencia."""
     if not values:
         return None
-    match metric:
-        case Metrics.LAST_VALUE:
-            return values[-1]
-        case Metrics.MEAN:
-            return statistics.mean(values)
-        case Metrics.ST_DEV:
-            return statistics.stdev(values) if len(values) > 1 else 0.0
+    # La ventana mantiene sus métricas de forma incremental; otras secuencias se recorren
+    table = _WINDOW_METRICS if isinstance(values, RollingWindow) else _SEQUENCE_METRICS
+    fn = table.get(metric)
+    return fn(values) if fn is not None else None
+
+
+def _float_stdev(values) -> float:
+    """
+    Desviación estándar muestral en coma flotante (dos pasadas con math.fsum).
+    statistics.stdev trabaja con fracciones exactas y es órdenes de magnitud más lenta.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean = math.fsum(values) / n
+    return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (n - 1))
 
 def check_match(computed_metric:float, comparator:Comparator, reference_value:float) -> bool:
     """
@@ -36,15 +126,51 @@ def check_match(computed_metric:float, comparator:Comparator, reference_value:fl
     """
 
     # Comprobar comparación
-    trigger = False
-    if computed_metric is not None:
-        if comparator == Comparator.LESS_THAN and computed_metric < reference_value:
-            trigger = True
-        elif comparator == Comparator.GREATER_THAN and computed_metric > reference_value:
-            trigger = True
-        elif comparator == Comparator.EQUAL_TO and computed_metric == reference_value:
-            trigger = True
-    return trigger
-
-check_match.__version__ = "1.0.0"
-compute_metric.__version__ = "1.0.0"
\ No newline at end of file
+    if computed_metric is None:
+        return False
+    compare = _COMPARATORS.get(comparator)
+    return compare is not None and compare(computed_metric, reference_value)
+
+
+# Tablas de despacho: el enum se resuelve una vez a una función en lugar de comparar en cada tick
+_COMPARATORS = {
+    Comparator.LESS_THAN: operator.lt,
+    Comparator.GREATER_THAN: operator.gt,
+    Comparator.EQUAL_TO: operator.eq,
+}
+
+_WINDOW_METRICS = {
+    Metrics.LAST_VALUE: operator.itemgetter(-1),
+    Metrics.MEAN: RollingWindow.mean,
+    Metrics.ST_DEV: RollingWindow.stdev,
+}
+
+_SEQUENCE_METRICS = {
+    Metrics.LAST_VALUE: operator.itemgetter(-1),
+    Metrics.MEAN: statistics.fmean,
+    Metrics.ST_DEV: _float_stdev,
+}
+
+
+def metric_function(metric: Metrics):
+    """
+    Devuelve la función `f(window) -> float` que calcula `metric` sobre una RollingWindow no vacía.
+    Acepta el miembro del enum o su valor ('mean', 'st_dev', ...).
+    :raises ValueError: Si la métrica no existe.
+    """
+    return _WINDOW_METRICS[Metrics(metric)]
+
+
+def comparator_function(comparator: Comparator):
+    """
+    Devuelve la función `f(computed_metric, reference_value) -> bool` del comparador.
+    Acepta el miembro del enum, su nombre ('LESS_THAN') o su valor ('less_than').
+    :raises ValueError: Si el comparador no existe.
+    """
+    if isinstance(comparator, str) and comparator in Comparator.__members__:
+        comparator = Comparator[comparator]
+    return _COMPARATORS[Comparator(comparator)]
+
+
+check_match.__version__ = "1.0.1"
+compute_metric.__version__ = "1.0.2"
\ No newline at end of file